@@ -0,0 +1,1083 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_artifact_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_artifact_api.proto',
+  package='org.apache.beam.model.job_management.v1',
+  syntax='proto3',
+  serialized_options=b'\n&org.apache.beam.model.jobmanagement.v1B\013ArtifactApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x17\x62\x65\x61m_artifact_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"|\n\x17ResolveArtifactsRequest\x12I\n\tartifacts\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12\x16\n\x0epreferred_urns\x18\x02 \x03(\t\"h\n\x18ResolveArtifactsResponse\x12L\n\x0creplacements\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"^\n\x12GetArtifactRequest\x12H\n\x08\x61rtifact\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"#\n\x13GetArtifactResponse\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xd8\x01\n\x16\x41rtifactRequestWrapper\x12]\n\x10resolve_artifact\x18\xe8\x07 \x01(\x0b\x32@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequestH\x00\x12T\n\x0cget_artifact\x18\xe9\x07 \x01(\x0b\x32;.org.apache.beam.model.job_management.v1.GetArtifactRequestH\x00\x42\t\n\x07request\"\x96\x02\n\x17\x41rtifactResponseWrapper\x12\x15\n\rstaging_token\x18\x01 \x01(\t\x12\x0f\n\x07is_last\x18\x02 \x01(\x08\x12g\n\x19resolve_artifact_response\x18\xe8\x07 \x01(\x0b\x32\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponseH\x00\x12^\n\x15get_artifact_response\x18\xe9\x07 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.GetArtifactResponseH\x00\x42\n\n\x08response\"E\n\x10\x41rtifactMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x01(\r\x12\x0e\n\x06sha256\x18\x04 \x01(\t\"W\n\x08Manifest\x12K\n\x08\x61rtifact\x18\x01 \x03(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xce\x01\n\rProxyManifest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12Q\n\x08location\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.job_management.v1.ProxyManifest.Location\x1a%\n\x08Location\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uri\x18\x02 \x01(\t\"-\n\x12GetManifestRequest\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"Z\n\x13GetManifestResponse\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\"A\n\x18LegacyGetArtifactRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\"\x1d\n\rArtifactChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x01\n\x13PutArtifactMetadata\x12\x1d\n\x15staging_session_token\x18\x01 \x01(\t\x12K\n\x08metadata\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xb9\x01\n\x12PutArtifactRequest\x12P\n\x08metadata\x18\x01 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.PutArtifactMetadataH\x00\x12\x46\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.ArtifactChunkH\x00\x42\t\n\x07\x63ontent\"\x15\n\x13PutArtifactResponse\"{\n\x15\x43ommitManifestRequest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12\x1d\n\x15staging_session_token\x18\x02 \x01(\t\"|\n\x16\x43ommitManifestResponse\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"I\n\tConstants\x12<\n\x19NO_ARTIFACTS_STAGED_TOKEN\x10\x00\x1a\x1d\xaa\xb4\xfa\xc2\x05\x17__no_artifacts_staged__2\xc1\x02\n\x18\x41rtifactRetrievalService\x12\x97\x01\n\x10ResolveArtifacts\x12@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequest\x1a\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponse\x12\x8a\x01\n\x0bGetArtifact\x12;.org.apache.beam.model.job_management.v1.GetArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.GetArtifactResponse0\x01\x32\xc3\x01\n\x16\x41rtifactStagingService\x12\xa8\x01\n\x1fReverseArtifactRetrievalService\x12@.org.apache.beam.model.job_management.v1.ArtifactResponseWrapper\x1a?.org.apache.beam.model.job_management.v1.ArtifactRequestWrapper(\x01\x30\x01\x32\xbf\x02\n\x1cLegacyArtifactStagingService\x12\x8a\x01\n\x0bPutArtifact\x12;.org.apache.beam.model.job_management.v1.PutArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.PutArtifactResponse(\x01\x12\x91\x01\n\x0e\x43ommitManifest\x12>.org.apache.beam.model.job_management.v1.CommitManifestRequest\x1a?.org.apache.beam.model.job_management.v1.CommitManifestResponse2\xb8\x02\n\x1eLegacyArtifactRetrievalService\x12\x88\x01\n\x0bGetManifest\x12;.org.apache.beam.model.job_management.v1.GetManifestRequest\x1a<.org.apache.beam.model.job_management.v1.GetManifestResponse\x12\x8a\x01\n\x0bGetArtifact\x12\x41.org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest\x1a\x36.org.apache.beam.model.job_management.v1.ArtifactChunk0\x01\x42\x86\x01\n&org.apache.beam.model.jobmanagement.v1B\x0b\x41rtifactApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3'
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,])
+
+
+
+_COMMITMANIFESTRESPONSE_CONSTANTS = _descriptor.EnumDescriptor(
+  name='Constants',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse.Constants',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NO_ARTIFACTS_STAGED_TOKEN', index=0, number=0,
+      serialized_options=b'\252\264\372\302\005\027__no_artifacts_staged__',
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2081,
+  serialized_end=2154,
+)
+_sym_db.RegisterEnumDescriptor(_COMMITMANIFESTRESPONSE_CONSTANTS)
+
+
+_RESOLVEARTIFACTSREQUEST = _descriptor.Descriptor(
+  name='ResolveArtifactsRequest',
+  full_name='org.apache.beam.model.job_management.v1.ResolveArtifactsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifacts', full_name='org.apache.beam.model.job_management.v1.ResolveArtifactsRequest.artifacts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='preferred_urns', full_name='org.apache.beam.model.job_management.v1.ResolveArtifactsRequest.preferred_urns', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=91,
+  serialized_end=215,
+)
+
+
+_RESOLVEARTIFACTSRESPONSE = _descriptor.Descriptor(
+  name='ResolveArtifactsResponse',
+  full_name='org.apache.beam.model.job_management.v1.ResolveArtifactsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='replacements', full_name='org.apache.beam.model.job_management.v1.ResolveArtifactsResponse.replacements', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=217,
+  serialized_end=321,
+)
+
+
+_GETARTIFACTREQUEST = _descriptor.Descriptor(
+  name='GetArtifactRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetArtifactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact', full_name='org.apache.beam.model.job_management.v1.GetArtifactRequest.artifact', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=323,
+  serialized_end=417,
+)
+
+
+_GETARTIFACTRESPONSE = _descriptor.Descriptor(
+  name='GetArtifactResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetArtifactResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.job_management.v1.GetArtifactResponse.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=419,
+  serialized_end=454,
+)
+
+
+_ARTIFACTREQUESTWRAPPER = _descriptor.Descriptor(
+  name='ArtifactRequestWrapper',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactRequestWrapper',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='resolve_artifact', full_name='org.apache.beam.model.job_management.v1.ArtifactRequestWrapper.resolve_artifact', index=0,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='get_artifact', full_name='org.apache.beam.model.job_management.v1.ArtifactRequestWrapper.get_artifact', index=1,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='request', full_name='org.apache.beam.model.job_management.v1.ArtifactRequestWrapper.request',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=457,
+  serialized_end=673,
+)
+
+
+_ARTIFACTRESPONSEWRAPPER = _descriptor.Descriptor(
+  name='ArtifactResponseWrapper',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='staging_token', full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper.staging_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='is_last', full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper.is_last', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='resolve_artifact_response', full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper.resolve_artifact_response', index=2,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='get_artifact_response', full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper.get_artifact_response', index=3,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='response', full_name='org.apache.beam.model.job_management.v1.ArtifactResponseWrapper.response',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=676,
+  serialized_end=954,
+)
+
+
+_ARTIFACTMETADATA = _descriptor.Descriptor(
+  name='ArtifactMetadata',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='permissions', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.permissions', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.sha256', index=2,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=956,
+  serialized_end=1025,
+)
+
+
+_MANIFEST = _descriptor.Descriptor(
+  name='Manifest',
+  full_name='org.apache.beam.model.job_management.v1.Manifest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact', full_name='org.apache.beam.model.job_management.v1.Manifest.artifact', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1027,
+  serialized_end=1114,
+)
+
+
+_PROXYMANIFEST_LOCATION = _descriptor.Descriptor(
+  name='Location',
+  full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='uri', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location.uri', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1286,
+  serialized_end=1323,
+)
+
+_PROXYMANIFEST = _descriptor.Descriptor(
+  name='ProxyManifest',
+  full_name='org.apache.beam.model.job_management.v1.ProxyManifest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='location', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.location', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROXYMANIFEST_LOCATION, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1117,
+  serialized_end=1323,
+)
+
+
+_GETMANIFESTREQUEST = _descriptor.Descriptor(
+  name='GetManifestRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetManifestRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.GetManifestRequest.retrieval_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1325,
+  serialized_end=1370,
+)
+
+
+_GETMANIFESTRESPONSE = _descriptor.Descriptor(
+  name='GetManifestResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetManifestResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.GetManifestResponse.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1372,
+  serialized_end=1462,
+)
+
+
+_LEGACYGETARTIFACTREQUEST = _descriptor.Descriptor(
+  name='LegacyGetArtifactRequest',
+  full_name='org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest.retrieval_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1464,
+  serialized_end=1529,
+)
+
+
+_ARTIFACTCHUNK = _descriptor.Descriptor(
+  name='ArtifactChunk',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactChunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.job_management.v1.ArtifactChunk.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1531,
+  serialized_end=1560,
+)
+
+
+_PUTARTIFACTMETADATA = _descriptor.Descriptor(
+  name='PutArtifactMetadata',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='staging_session_token', full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata.staging_session_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='metadata', full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata.metadata', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1563,
+  serialized_end=1692,
+)
+
+
+_PUTARTIFACTREQUEST = _descriptor.Descriptor(
+  name='PutArtifactRequest',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metadata', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.metadata', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='content', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.content',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1695,
+  serialized_end=1880,
+)
+
+
+_PUTARTIFACTRESPONSE = _descriptor.Descriptor(
+  name='PutArtifactResponse',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1882,
+  serialized_end=1903,
+)
+
+
+_COMMITMANIFESTREQUEST = _descriptor.Descriptor(
+  name='CommitManifestRequest',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='staging_session_token', full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest.staging_session_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1905,
+  serialized_end=2028,
+)
+
+
+_COMMITMANIFESTRESPONSE = _descriptor.Descriptor(
+  name='CommitManifestResponse',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse.retrieval_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _COMMITMANIFESTRESPONSE_CONSTANTS,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2030,
+  serialized_end=2154,
+)
+
+_RESOLVEARTIFACTSREQUEST.fields_by_name['artifacts'].message_type = beam__runner__api__pb2._ARTIFACTINFORMATION
+_RESOLVEARTIFACTSRESPONSE.fields_by_name['replacements'].message_type = beam__runner__api__pb2._ARTIFACTINFORMATION
+_GETARTIFACTREQUEST.fields_by_name['artifact'].message_type = beam__runner__api__pb2._ARTIFACTINFORMATION
+_ARTIFACTREQUESTWRAPPER.fields_by_name['resolve_artifact'].message_type = _RESOLVEARTIFACTSREQUEST
+_ARTIFACTREQUESTWRAPPER.fields_by_name['get_artifact'].message_type = _GETARTIFACTREQUEST
+_ARTIFACTREQUESTWRAPPER.oneofs_by_name['request'].fields.append(
+  _ARTIFACTREQUESTWRAPPER.fields_by_name['resolve_artifact'])
+_ARTIFACTREQUESTWRAPPER.fields_by_name['resolve_artifact'].containing_oneof = _ARTIFACTREQUESTWRAPPER.oneofs_by_name['request']
+_ARTIFACTREQUESTWRAPPER.oneofs_by_name['request'].fields.append(
+  _ARTIFACTREQUESTWRAPPER.fields_by_name['get_artifact'])
+_ARTIFACTREQUESTWRAPPER.fields_by_name['get_artifact'].containing_oneof = _ARTIFACTREQUESTWRAPPER.oneofs_by_name['request']
+_ARTIFACTRESPONSEWRAPPER.fields_by_name['resolve_artifact_response'].message_type = _RESOLVEARTIFACTSRESPONSE
+_ARTIFACTRESPONSEWRAPPER.fields_by_name['get_artifact_response'].message_type = _GETARTIFACTRESPONSE
+_ARTIFACTRESPONSEWRAPPER.oneofs_by_name['response'].fields.append(
+  _ARTIFACTRESPONSEWRAPPER.fields_by_name['resolve_artifact_response'])
+_ARTIFACTRESPONSEWRAPPER.fields_by_name['resolve_artifact_response'].containing_oneof = _ARTIFACTRESPONSEWRAPPER.oneofs_by_name['response']
+_ARTIFACTRESPONSEWRAPPER.oneofs_by_name['response'].fields.append(
+  _ARTIFACTRESPONSEWRAPPER.fields_by_name['get_artifact_response'])
+_ARTIFACTRESPONSEWRAPPER.fields_by_name['get_artifact_response'].containing_oneof = _ARTIFACTRESPONSEWRAPPER.oneofs_by_name['response']
+_MANIFEST.fields_by_name['artifact'].message_type = _ARTIFACTMETADATA
+_PROXYMANIFEST_LOCATION.containing_type = _PROXYMANIFEST
+_PROXYMANIFEST.fields_by_name['manifest'].message_type = _MANIFEST
+_PROXYMANIFEST.fields_by_name['location'].message_type = _PROXYMANIFEST_LOCATION
+_GETMANIFESTRESPONSE.fields_by_name['manifest'].message_type = _MANIFEST
+_PUTARTIFACTMETADATA.fields_by_name['metadata'].message_type = _ARTIFACTMETADATA
+_PUTARTIFACTREQUEST.fields_by_name['metadata'].message_type = _PUTARTIFACTMETADATA
+_PUTARTIFACTREQUEST.fields_by_name['data'].message_type = _ARTIFACTCHUNK
+_PUTARTIFACTREQUEST.oneofs_by_name['content'].fields.append(
+  _PUTARTIFACTREQUEST.fields_by_name['metadata'])
+_PUTARTIFACTREQUEST.fields_by_name['metadata'].containing_oneof = _PUTARTIFACTREQUEST.oneofs_by_name['content']
+_PUTARTIFACTREQUEST.oneofs_by_name['content'].fields.append(
+  _PUTARTIFACTREQUEST.fields_by_name['data'])
+_PUTARTIFACTREQUEST.fields_by_name['data'].containing_oneof = _PUTARTIFACTREQUEST.oneofs_by_name['content']
+_COMMITMANIFESTREQUEST.fields_by_name['manifest'].message_type = _MANIFEST
+_COMMITMANIFESTRESPONSE_CONSTANTS.containing_type = _COMMITMANIFESTRESPONSE
+DESCRIPTOR.message_types_by_name['ResolveArtifactsRequest'] = _RESOLVEARTIFACTSREQUEST
+DESCRIPTOR.message_types_by_name['ResolveArtifactsResponse'] = _RESOLVEARTIFACTSRESPONSE
+DESCRIPTOR.message_types_by_name['GetArtifactRequest'] = _GETARTIFACTREQUEST
+DESCRIPTOR.message_types_by_name['GetArtifactResponse'] = _GETARTIFACTRESPONSE
+DESCRIPTOR.message_types_by_name['ArtifactRequestWrapper'] = _ARTIFACTREQUESTWRAPPER
+DESCRIPTOR.message_types_by_name['ArtifactResponseWrapper'] = _ARTIFACTRESPONSEWRAPPER
+DESCRIPTOR.message_types_by_name['ArtifactMetadata'] = _ARTIFACTMETADATA
+DESCRIPTOR.message_types_by_name['Manifest'] = _MANIFEST
+DESCRIPTOR.message_types_by_name['ProxyManifest'] = _PROXYMANIFEST
+DESCRIPTOR.message_types_by_name['GetManifestRequest'] = _GETMANIFESTREQUEST
+DESCRIPTOR.message_types_by_name['GetManifestResponse'] = _GETMANIFESTRESPONSE
+DESCRIPTOR.message_types_by_name['LegacyGetArtifactRequest'] = _LEGACYGETARTIFACTREQUEST
+DESCRIPTOR.message_types_by_name['ArtifactChunk'] = _ARTIFACTCHUNK
+DESCRIPTOR.message_types_by_name['PutArtifactMetadata'] = _PUTARTIFACTMETADATA
+DESCRIPTOR.message_types_by_name['PutArtifactRequest'] = _PUTARTIFACTREQUEST
+DESCRIPTOR.message_types_by_name['PutArtifactResponse'] = _PUTARTIFACTRESPONSE
+DESCRIPTOR.message_types_by_name['CommitManifestRequest'] = _COMMITMANIFESTREQUEST
+DESCRIPTOR.message_types_by_name['CommitManifestResponse'] = _COMMITMANIFESTRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ResolveArtifactsRequest = _reflection.GeneratedProtocolMessageType('ResolveArtifactsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RESOLVEARTIFACTSREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ResolveArtifactsRequest)
+  })
+_sym_db.RegisterMessage(ResolveArtifactsRequest)
+
+ResolveArtifactsResponse = _reflection.GeneratedProtocolMessageType('ResolveArtifactsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _RESOLVEARTIFACTSRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ResolveArtifactsResponse)
+  })
+_sym_db.RegisterMessage(ResolveArtifactsResponse)
+
+GetArtifactRequest = _reflection.GeneratedProtocolMessageType('GetArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetArtifactRequest)
+  })
+_sym_db.RegisterMessage(GetArtifactRequest)
+
+GetArtifactResponse = _reflection.GeneratedProtocolMessageType('GetArtifactResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETARTIFACTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetArtifactResponse)
+  })
+_sym_db.RegisterMessage(GetArtifactResponse)
+
+ArtifactRequestWrapper = _reflection.GeneratedProtocolMessageType('ArtifactRequestWrapper', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTREQUESTWRAPPER,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactRequestWrapper)
+  })
+_sym_db.RegisterMessage(ArtifactRequestWrapper)
+
+ArtifactResponseWrapper = _reflection.GeneratedProtocolMessageType('ArtifactResponseWrapper', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTRESPONSEWRAPPER,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactResponseWrapper)
+  })
+_sym_db.RegisterMessage(ArtifactResponseWrapper)
+
+ArtifactMetadata = _reflection.GeneratedProtocolMessageType('ArtifactMetadata', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTMETADATA,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactMetadata)
+  })
+_sym_db.RegisterMessage(ArtifactMetadata)
+
+Manifest = _reflection.GeneratedProtocolMessageType('Manifest', (_message.Message,), {
+  'DESCRIPTOR' : _MANIFEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.Manifest)
+  })
+_sym_db.RegisterMessage(Manifest)
+
+ProxyManifest = _reflection.GeneratedProtocolMessageType('ProxyManifest', (_message.Message,), {
+
+  'Location' : _reflection.GeneratedProtocolMessageType('Location', (_message.Message,), {
+    'DESCRIPTOR' : _PROXYMANIFEST_LOCATION,
+    '__module__' : 'beam_artifact_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest.Location)
+    })
+  ,
+  'DESCRIPTOR' : _PROXYMANIFEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest)
+  })
+_sym_db.RegisterMessage(ProxyManifest)
+_sym_db.RegisterMessage(ProxyManifest.Location)
+
+GetManifestRequest = _reflection.GeneratedProtocolMessageType('GetManifestRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETMANIFESTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestRequest)
+  })
+_sym_db.RegisterMessage(GetManifestRequest)
+
+GetManifestResponse = _reflection.GeneratedProtocolMessageType('GetManifestResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETMANIFESTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestResponse)
+  })
+_sym_db.RegisterMessage(GetManifestResponse)
+
+LegacyGetArtifactRequest = _reflection.GeneratedProtocolMessageType('LegacyGetArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LEGACYGETARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest)
+  })
+_sym_db.RegisterMessage(LegacyGetArtifactRequest)
+
+ArtifactChunk = _reflection.GeneratedProtocolMessageType('ArtifactChunk', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTCHUNK,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactChunk)
+  })
+_sym_db.RegisterMessage(ArtifactChunk)
+
+PutArtifactMetadata = _reflection.GeneratedProtocolMessageType('PutArtifactMetadata', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTMETADATA,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactMetadata)
+  })
+_sym_db.RegisterMessage(PutArtifactMetadata)
+
+PutArtifactRequest = _reflection.GeneratedProtocolMessageType('PutArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactRequest)
+  })
+_sym_db.RegisterMessage(PutArtifactRequest)
+
+PutArtifactResponse = _reflection.GeneratedProtocolMessageType('PutArtifactResponse', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactResponse)
+  })
+_sym_db.RegisterMessage(PutArtifactResponse)
+
+CommitManifestRequest = _reflection.GeneratedProtocolMessageType('CommitManifestRequest', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITMANIFESTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestRequest)
+  })
+_sym_db.RegisterMessage(CommitManifestRequest)
+
+CommitManifestResponse = _reflection.GeneratedProtocolMessageType('CommitManifestResponse', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITMANIFESTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestResponse)
+  })
+_sym_db.RegisterMessage(CommitManifestResponse)
+
+
+DESCRIPTOR._options = None
+_COMMITMANIFESTRESPONSE_CONSTANTS.values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._options = None
+
+_ARTIFACTRETRIEVALSERVICE = _descriptor.ServiceDescriptor(
+  name='ArtifactRetrievalService',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=2157,
+  serialized_end=2478,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='ResolveArtifacts',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService.ResolveArtifacts',
+    index=0,
+    containing_service=None,
+    input_type=_RESOLVEARTIFACTSREQUEST,
+    output_type=_RESOLVEARTIFACTSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetArtifact',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService.GetArtifact',
+    index=1,
+    containing_service=None,
+    input_type=_GETARTIFACTREQUEST,
+    output_type=_GETARTIFACTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_ARTIFACTRETRIEVALSERVICE)
+
+DESCRIPTOR.services_by_name['ArtifactRetrievalService'] = _ARTIFACTRETRIEVALSERVICE
+
+
+_ARTIFACTSTAGINGSERVICE = _descriptor.ServiceDescriptor(
+  name='ArtifactStagingService',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactStagingService',
+  file=DESCRIPTOR,
+  index=1,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=2481,
+  serialized_end=2676,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='ReverseArtifactRetrievalService',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactStagingService.ReverseArtifactRetrievalService',
+    index=0,
+    containing_service=None,
+    input_type=_ARTIFACTRESPONSEWRAPPER,
+    output_type=_ARTIFACTREQUESTWRAPPER,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_ARTIFACTSTAGINGSERVICE)
+
+DESCRIPTOR.services_by_name['ArtifactStagingService'] = _ARTIFACTSTAGINGSERVICE
+
+
+_LEGACYARTIFACTSTAGINGSERVICE = _descriptor.ServiceDescriptor(
+  name='LegacyArtifactStagingService',
+  full_name='org.apache.beam.model.job_management.v1.LegacyArtifactStagingService',
+  file=DESCRIPTOR,
+  index=2,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=2679,
+  serialized_end=2998,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='PutArtifact',
+    full_name='org.apache.beam.model.job_management.v1.LegacyArtifactStagingService.PutArtifact',
+    index=0,
+    containing_service=None,
+    input_type=_PUTARTIFACTREQUEST,
+    output_type=_PUTARTIFACTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='CommitManifest',
+    full_name='org.apache.beam.model.job_management.v1.LegacyArtifactStagingService.CommitManifest',
+    index=1,
+    containing_service=None,
+    input_type=_COMMITMANIFESTREQUEST,
+    output_type=_COMMITMANIFESTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_LEGACYARTIFACTSTAGINGSERVICE)
+
+DESCRIPTOR.services_by_name['LegacyArtifactStagingService'] = _LEGACYARTIFACTSTAGINGSERVICE
+
+
+_LEGACYARTIFACTRETRIEVALSERVICE = _descriptor.ServiceDescriptor(
+  name='LegacyArtifactRetrievalService',
+  full_name='org.apache.beam.model.job_management.v1.LegacyArtifactRetrievalService',
+  file=DESCRIPTOR,
+  index=3,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=3001,
+  serialized_end=3313,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='GetManifest',
+    full_name='org.apache.beam.model.job_management.v1.LegacyArtifactRetrievalService.GetManifest',
+    index=0,
+    containing_service=None,
+    input_type=_GETMANIFESTREQUEST,
+    output_type=_GETMANIFESTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetArtifact',
+    full_name='org.apache.beam.model.job_management.v1.LegacyArtifactRetrievalService.GetArtifact',
+    index=1,
+    containing_service=None,
+    input_type=_LEGACYGETARTIFACTREQUEST,
+    output_type=_ARTIFACTCHUNK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_LEGACYARTIFACTRETRIEVALSERVICE)
+
+DESCRIPTOR.services_by_name['LegacyArtifactRetrievalService'] = _LEGACYARTIFACTRETRIEVALSERVICE
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_expansion_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_expansion_api.proto',
+  package='org.apache.beam.model.expansion.v1',
+  syntax='proto3',
+  serialized_options=b'\n\"org.apache.beam.model.expansion.v1B\014ExpansionApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x18\x62\x65\x61m_expansion_api.proto\x12\"org.apache.beam.model.expansion.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"\xaa\x01\n\x10\x45xpansionRequest\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x11\n\tnamespace\x18\x03 \x01(\t\"\xbd\x01\n\x11\x45xpansionResponse\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x14\n\x0crequirements\x18\x03 \x03(\t\x12\r\n\x05\x65rror\x18\n \x01(\t2\x89\x01\n\x10\x45xpansionService\x12u\n\x06\x45xpand\x12\x34.org.apache.beam.model.expansion.v1.ExpansionRequest\x1a\x35.org.apache.beam.model.expansion.v1.ExpansionResponseB\x83\x01\n\"org.apache.beam.model.expansion.v1B\x0c\x45xpansionApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3'
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,])
+
+
+
+
+_EXPANSIONREQUEST = _descriptor.Descriptor(
+  name='ExpansionRequest',
+  full_name='org.apache.beam.model.expansion.v1.ExpansionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='components', full_name='org.apache.beam.model.expansion.v1.ExpansionRequest.components', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='transform', full_name='org.apache.beam.model.expansion.v1.ExpansionRequest.transform', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='namespace', full_name='org.apache.beam.model.expansion.v1.ExpansionRequest.namespace', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=88,
+  serialized_end=258,
+)
+
+
+_EXPANSIONRESPONSE = _descriptor.Descriptor(
+  name='ExpansionResponse',
+  full_name='org.apache.beam.model.expansion.v1.ExpansionResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='components', full_name='org.apache.beam.model.expansion.v1.ExpansionResponse.components', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='transform', full_name='org.apache.beam.model.expansion.v1.ExpansionResponse.transform', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='requirements', full_name='org.apache.beam.model.expansion.v1.ExpansionResponse.requirements', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.expansion.v1.ExpansionResponse.error', index=3,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=261,
+  serialized_end=450,
+)
+
+_EXPANSIONREQUEST.fields_by_name['components'].message_type = beam__runner__api__pb2._COMPONENTS
+_EXPANSIONREQUEST.fields_by_name['transform'].message_type = beam__runner__api__pb2._PTRANSFORM
+_EXPANSIONRESPONSE.fields_by_name['components'].message_type = beam__runner__api__pb2._COMPONENTS
+_EXPANSIONRESPONSE.fields_by_name['transform'].message_type = beam__runner__api__pb2._PTRANSFORM
+DESCRIPTOR.message_types_by_name['ExpansionRequest'] = _EXPANSIONREQUEST
+DESCRIPTOR.message_types_by_name['ExpansionResponse'] = _EXPANSIONRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ExpansionRequest = _reflection.GeneratedProtocolMessageType('ExpansionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONREQUEST,
+  '__module__' : 'beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionRequest)
+  })
+_sym_db.RegisterMessage(ExpansionRequest)
+
+ExpansionResponse = _reflection.GeneratedProtocolMessageType('ExpansionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONRESPONSE,
+  '__module__' : 'beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionResponse)
+  })
+_sym_db.RegisterMessage(ExpansionResponse)
+
+
+DESCRIPTOR._options = None
+
+_EXPANSIONSERVICE = _descriptor.ServiceDescriptor(
+  name='ExpansionService',
+  full_name='org.apache.beam.model.expansion.v1.ExpansionService',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=453,
+  serialized_end=590,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Expand',
+    full_name='org.apache.beam.model.expansion.v1.ExpansionService.Expand',
+    index=0,
+    containing_service=None,
+    input_type=_EXPANSIONREQUEST,
+    output_type=_EXPANSIONRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_EXPANSIONSERVICE)
+
+DESCRIPTOR.services_by_name['ExpansionService'] = _EXPANSIONSERVICE
+
+# @@protoc_insertion_point(module_scope)
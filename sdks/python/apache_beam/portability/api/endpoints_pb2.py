@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: endpoints.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='endpoints.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_options=b'\n!org.apache.beam.model.pipeline.v1B\tEndpointsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x0f\x65ndpoints.proto\x12!org.apache.beam.model.pipeline.v1\"r\n\x14\x41piServiceDescriptor\x12\x0b\n\x03url\x18\x01 \x01(\t\x12M\n\x0e\x61uthentication\x18\x02 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.AuthenticationSpec\"2\n\x12\x41uthenticationSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x42u\n!org.apache.beam.model.pipeline.v1B\tEndpointsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3'
+)
+
+
+
+
+_APISERVICEDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiServiceDescriptor',
+  full_name='org.apache.beam.model.pipeline.v1.ApiServiceDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='url', full_name='org.apache.beam.model.pipeline.v1.ApiServiceDescriptor.url', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='authentication', full_name='org.apache.beam.model.pipeline.v1.ApiServiceDescriptor.authentication', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=54,
+  serialized_end=168,
+)
+
+
+_AUTHENTICATIONSPEC = _descriptor.Descriptor(
+  name='AuthenticationSpec',
+  full_name='org.apache.beam.model.pipeline.v1.AuthenticationSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.AuthenticationSpec.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.AuthenticationSpec.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=170,
+  serialized_end=220,
+)
+
+_APISERVICEDESCRIPTOR.fields_by_name['authentication'].message_type = _AUTHENTICATIONSPEC
+DESCRIPTOR.message_types_by_name['ApiServiceDescriptor'] = _APISERVICEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['AuthenticationSpec'] = _AUTHENTICATIONSPEC
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiServiceDescriptor = _reflection.GeneratedProtocolMessageType('ApiServiceDescriptor', (_message.Message,), {
+  'DESCRIPTOR' : _APISERVICEDESCRIPTOR,
+  '__module__' : 'endpoints_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ApiServiceDescriptor)
+  })
+_sym_db.RegisterMessage(ApiServiceDescriptor)
+
+AuthenticationSpec = _reflection.GeneratedProtocolMessageType('AuthenticationSpec', (_message.Message,), {
+  'DESCRIPTOR' : _AUTHENTICATIONSPEC,
+  '__module__' : 'endpoints_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.AuthenticationSpec)
+  })
+_sym_db.RegisterMessage(AuthenticationSpec)
+
+
+DESCRIPTOR._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: external_transforms.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import schema_pb2 as schema__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='external_transforms.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_options=b'\n!org.apache.beam.model.pipeline.v1B\022ExternalTransformsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x19\x65xternal_transforms.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x0cschema.proto\"j\n\x1c\x45xternalConfigurationPayload\x12\x39\n\x06schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x42~\n!org.apache.beam.model.pipeline.v1B\x12\x45xternalTransformsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3'
+  ,
+  dependencies=[schema__pb2.DESCRIPTOR,])
+
+
+
+
+_EXTERNALCONFIGURATIONPAYLOAD = _descriptor.Descriptor(
+  name='ExternalConfigurationPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='schema', full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.schema', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=78,
+  serialized_end=184,
+)
+
+_EXTERNALCONFIGURATIONPAYLOAD.fields_by_name['schema'].message_type = schema__pb2._SCHEMA
+DESCRIPTOR.message_types_by_name['ExternalConfigurationPayload'] = _EXTERNALCONFIGURATIONPAYLOAD
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ExternalConfigurationPayload = _reflection.GeneratedProtocolMessageType('ExternalConfigurationPayload', (_message.Message,), {
+  'DESCRIPTOR' : _EXTERNALCONFIGURATIONPAYLOAD,
+  '__module__' : 'external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload)
+  })
+_sym_db.RegisterMessage(ExternalConfigurationPayload)
+
+
+DESCRIPTOR._options = None
+# @@protoc_insertion_point(module_scope)
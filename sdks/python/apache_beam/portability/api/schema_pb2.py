@@ -0,0 +1,1145 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: schema.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='schema.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_options=b'\n!org.apache.beam.model.pipeline.v1B\tSchemaApiZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x0cschema.proto\x12!org.apache.beam.model.pipeline.v1\"\xaa\x01\n\x06Schema\x12\x38\n\x06\x66ields\x18\x01 \x03(\x0b\x32(.org.apache.beam.model.pipeline.v1.Field\x12\n\n\x02id\x18\x02 \x01(\t\x12:\n\x07options\x18\x03 \x03(\x0b\x32).org.apache.beam.model.pipeline.v1.Option\x12\x1e\n\x16\x65ncoding_positions_set\x18\x04 \x01(\x08\"\xc9\x01\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12:\n\x04type\x18\x03 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\x12\n\n\x02id\x18\x04 \x01(\x05\x12\x19\n\x11\x65ncoding_position\x18\x05 \x01(\x05\x12:\n\x07options\x18\x06 \x03(\x0b\x32).org.apache.beam.model.pipeline.v1.Option\"\xc6\x03\n\tFieldType\x12\x10\n\x08nullable\x18\x01 \x01(\x08\x12\x44\n\x0b\x61tomic_type\x18\x02 \x01(\x0e\x32-.org.apache.beam.model.pipeline.v1.AtomicTypeH\x00\x12\x42\n\narray_type\x18\x03 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.ArrayTypeH\x00\x12H\n\riterable_type\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.IterableTypeH\x00\x12>\n\x08map_type\x18\x05 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.MapTypeH\x00\x12>\n\x08row_type\x18\x06 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.RowTypeH\x00\x12\x46\n\x0clogical_type\x18\x07 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.LogicalTypeH\x00\x42\x0b\n\ttype_info\"O\n\tArrayType\x12\x42\n\x0c\x65lement_type\x18\x01 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\"R\n\x0cIterableType\x12\x42\n\x0c\x65lement_type\x18\x01 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\"\x8b\x01\n\x07MapType\x12>\n\x08key_type\x18\x01 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\x12@\n\nvalue_type\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\"D\n\x07RowType\x12\x39\n\x06schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\"\xf7\x01\n\x0bLogicalType\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x12\x44\n\x0erepresentation\x18\x03 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\x12\x43\n\rargument_type\x18\x04 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\x12?\n\x08\x61rgument\x18\x05 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"\x90\x01\n\x06Option\x12\x0c\n\x04name\x18\x01 \x01(\t\x12:\n\x04type\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.FieldType\x12<\n\x05value\x18\x03 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"D\n\x03Row\x12=\n\x06values\x18\x01 \x03(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"\xd7\x03\n\nFieldValue\x12J\n\x0c\x61tomic_value\x18\x01 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.AtomicTypeValueH\x00\x12H\n\x0b\x61rray_value\x18\x02 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.ArrayTypeValueH\x00\x12N\n\x0eiterable_value\x18\x03 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.IterableTypeValueH\x00\x12\x44\n\tmap_value\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.MapTypeValueH\x00\x12;\n\trow_value\x18\x05 \x01(\x0b\x32&.org.apache.beam.model.pipeline.v1.RowH\x00\x12Q\n\x12logical_type_value\x18\x06 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.LogicalTypeValueH\x00\x42\r\n\x0b\x66ield_value\"\xb6\x01\n\x0f\x41tomicTypeValue\x12\x0e\n\x04\x62yte\x18\x01 \x01(\x05H\x00\x12\x0f\n\x05int16\x18\x02 \x01(\x05H\x00\x12\x0f\n\x05int32\x18\x03 \x01(\x05H\x00\x12\x0f\n\x05int64\x18\x04 \x01(\x03H\x00\x12\x0f\n\x05\x66loat\x18\x05 \x01(\x02H\x00\x12\x10\n\x06\x64ouble\x18\x06 \x01(\x01H\x00\x12\x10\n\x06string\x18\x07 \x01(\tH\x00\x12\x11\n\x07\x62oolean\x18\x08 \x01(\x08H\x00\x12\x0f\n\x05\x62ytes\x18\t \x01(\x0cH\x00\x42\x07\n\x05value\"P\n\x0e\x41rrayTypeValue\x12>\n\x07\x65lement\x18\x01 \x03(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"S\n\x11IterableTypeValue\x12>\n\x07\x65lement\x18\x01 \x03(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"P\n\x0cMapTypeValue\x12@\n\x07\x65ntries\x18\x01 \x03(\x0b\x32/.org.apache.beam.model.pipeline.v1.MapTypeEntry\"\x88\x01\n\x0cMapTypeEntry\x12:\n\x03key\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue\"P\n\x10LogicalTypeValue\x12<\n\x05value\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.FieldValue*\x83\x01\n\nAtomicType\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x08\n\x04\x42YTE\x10\x01\x12\t\n\x05INT16\x10\x02\x12\t\n\x05INT32\x10\x03\x12\t\n\x05INT64\x10\x04\x12\t\n\x05\x46LOAT\x10\x05\x12\n\n\x06\x44OUBLE\x10\x06\x12\n\n\x06STRING\x10\x07\x12\x0b\n\x07\x42OOLEAN\x10\x08\x12\t\n\x05\x42YTES\x10\tBu\n!org.apache.beam.model.pipeline.v1B\tSchemaApiZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3'
+)
+
+_ATOMICTYPE = _descriptor.EnumDescriptor(
+  name='AtomicType',
+  full_name='org.apache.beam.model.pipeline.v1.AtomicType',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='BYTE', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='INT16', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='INT32', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='INT64', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='FLOAT', index=5, number=5,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='DOUBLE', index=6, number=6,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='STRING', index=7, number=7,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='BOOLEAN', index=8, number=8,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='BYTES', index=9, number=9,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2859,
+  serialized_end=2990,
+)
+_sym_db.RegisterEnumDescriptor(_ATOMICTYPE)
+
+AtomicType = enum_type_wrapper.EnumTypeWrapper(_ATOMICTYPE)
+UNSPECIFIED = 0
+BYTE = 1
+INT16 = 2
+INT32 = 3
+INT64 = 4
+FLOAT = 5
+DOUBLE = 6
+STRING = 7
+BOOLEAN = 8
+BYTES = 9
+
+
+
+_SCHEMA = _descriptor.Descriptor(
+  name='Schema',
+  full_name='org.apache.beam.model.pipeline.v1.Schema',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='org.apache.beam.model.pipeline.v1.Schema.fields', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.pipeline.v1.Schema.id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='org.apache.beam.model.pipeline.v1.Schema.options', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='encoding_positions_set', full_name='org.apache.beam.model.pipeline.v1.Schema.encoding_positions_set', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=52,
+  serialized_end=222,
+)
+
+
+_FIELD = _descriptor.Descriptor(
+  name='Field',
+  full_name='org.apache.beam.model.pipeline.v1.Field',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.pipeline.v1.Field.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='org.apache.beam.model.pipeline.v1.Field.description', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='org.apache.beam.model.pipeline.v1.Field.type', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.pipeline.v1.Field.id', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='encoding_position', full_name='org.apache.beam.model.pipeline.v1.Field.encoding_position', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='org.apache.beam.model.pipeline.v1.Field.options', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=225,
+  serialized_end=426,
+)
+
+
+_FIELDTYPE = _descriptor.Descriptor(
+  name='FieldType',
+  full_name='org.apache.beam.model.pipeline.v1.FieldType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='nullable', full_name='org.apache.beam.model.pipeline.v1.FieldType.nullable', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='atomic_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.atomic_type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='array_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.array_type', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='iterable_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.iterable_type', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='map_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.map_type', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='row_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.row_type', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='logical_type', full_name='org.apache.beam.model.pipeline.v1.FieldType.logical_type', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='type_info', full_name='org.apache.beam.model.pipeline.v1.FieldType.type_info',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=429,
+  serialized_end=883,
+)
+
+
+_ARRAYTYPE = _descriptor.Descriptor(
+  name='ArrayType',
+  full_name='org.apache.beam.model.pipeline.v1.ArrayType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element_type', full_name='org.apache.beam.model.pipeline.v1.ArrayType.element_type', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=885,
+  serialized_end=964,
+)
+
+
+_ITERABLETYPE = _descriptor.Descriptor(
+  name='IterableType',
+  full_name='org.apache.beam.model.pipeline.v1.IterableType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element_type', full_name='org.apache.beam.model.pipeline.v1.IterableType.element_type', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=966,
+  serialized_end=1048,
+)
+
+
+_MAPTYPE = _descriptor.Descriptor(
+  name='MapType',
+  full_name='org.apache.beam.model.pipeline.v1.MapType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key_type', full_name='org.apache.beam.model.pipeline.v1.MapType.key_type', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value_type', full_name='org.apache.beam.model.pipeline.v1.MapType.value_type', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1051,
+  serialized_end=1190,
+)
+
+
+_ROWTYPE = _descriptor.Descriptor(
+  name='RowType',
+  full_name='org.apache.beam.model.pipeline.v1.RowType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='schema', full_name='org.apache.beam.model.pipeline.v1.RowType.schema', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1192,
+  serialized_end=1260,
+)
+
+
+_LOGICALTYPE = _descriptor.Descriptor(
+  name='LogicalType',
+  full_name='org.apache.beam.model.pipeline.v1.LogicalType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.LogicalType.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.LogicalType.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='representation', full_name='org.apache.beam.model.pipeline.v1.LogicalType.representation', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='argument_type', full_name='org.apache.beam.model.pipeline.v1.LogicalType.argument_type', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='argument', full_name='org.apache.beam.model.pipeline.v1.LogicalType.argument', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1263,
+  serialized_end=1510,
+)
+
+
+_OPTION = _descriptor.Descriptor(
+  name='Option',
+  full_name='org.apache.beam.model.pipeline.v1.Option',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.pipeline.v1.Option.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='org.apache.beam.model.pipeline.v1.Option.type', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Option.value', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1513,
+  serialized_end=1657,
+)
+
+
+_ROW = _descriptor.Descriptor(
+  name='Row',
+  full_name='org.apache.beam.model.pipeline.v1.Row',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='values', full_name='org.apache.beam.model.pipeline.v1.Row.values', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1659,
+  serialized_end=1727,
+)
+
+
+_FIELDVALUE = _descriptor.Descriptor(
+  name='FieldValue',
+  full_name='org.apache.beam.model.pipeline.v1.FieldValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='atomic_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.atomic_value', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='array_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.array_value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='iterable_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.iterable_value', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='map_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.map_value', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='row_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.row_value', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='logical_type_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.logical_type_value', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='field_value', full_name='org.apache.beam.model.pipeline.v1.FieldValue.field_value',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1730,
+  serialized_end=2201,
+)
+
+
+_ATOMICTYPEVALUE = _descriptor.Descriptor(
+  name='AtomicTypeValue',
+  full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='byte', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.byte', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='int16', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.int16', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='int32', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.int32', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='int64', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.int64', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='float', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.float', index=4,
+      number=5, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='double', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.double', index=5,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='string', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.string', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='boolean', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.boolean', index=7,
+      number=8, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bytes', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.bytes', index=8,
+      number=9, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.AtomicTypeValue.value',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=2204,
+  serialized_end=2386,
+)
+
+
+_ARRAYTYPEVALUE = _descriptor.Descriptor(
+  name='ArrayTypeValue',
+  full_name='org.apache.beam.model.pipeline.v1.ArrayTypeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element', full_name='org.apache.beam.model.pipeline.v1.ArrayTypeValue.element', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2388,
+  serialized_end=2468,
+)
+
+
+_ITERABLETYPEVALUE = _descriptor.Descriptor(
+  name='IterableTypeValue',
+  full_name='org.apache.beam.model.pipeline.v1.IterableTypeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element', full_name='org.apache.beam.model.pipeline.v1.IterableTypeValue.element', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2470,
+  serialized_end=2553,
+)
+
+
+_MAPTYPEVALUE = _descriptor.Descriptor(
+  name='MapTypeValue',
+  full_name='org.apache.beam.model.pipeline.v1.MapTypeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='entries', full_name='org.apache.beam.model.pipeline.v1.MapTypeValue.entries', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2555,
+  serialized_end=2635,
+)
+
+
+_MAPTYPEENTRY = _descriptor.Descriptor(
+  name='MapTypeEntry',
+  full_name='org.apache.beam.model.pipeline.v1.MapTypeEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.MapTypeEntry.key', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.MapTypeEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2638,
+  serialized_end=2774,
+)
+
+
+_LOGICALTYPEVALUE = _descriptor.Descriptor(
+  name='LogicalTypeValue',
+  full_name='org.apache.beam.model.pipeline.v1.LogicalTypeValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.LogicalTypeValue.value', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2776,
+  serialized_end=2856,
+)
+
+_SCHEMA.fields_by_name['fields'].message_type = _FIELD
+_SCHEMA.fields_by_name['options'].message_type = _OPTION
+_FIELD.fields_by_name['type'].message_type = _FIELDTYPE
+_FIELD.fields_by_name['options'].message_type = _OPTION
+_FIELDTYPE.fields_by_name['atomic_type'].enum_type = _ATOMICTYPE
+_FIELDTYPE.fields_by_name['array_type'].message_type = _ARRAYTYPE
+_FIELDTYPE.fields_by_name['iterable_type'].message_type = _ITERABLETYPE
+_FIELDTYPE.fields_by_name['map_type'].message_type = _MAPTYPE
+_FIELDTYPE.fields_by_name['row_type'].message_type = _ROWTYPE
+_FIELDTYPE.fields_by_name['logical_type'].message_type = _LOGICALTYPE
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['atomic_type'])
+_FIELDTYPE.fields_by_name['atomic_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['array_type'])
+_FIELDTYPE.fields_by_name['array_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['iterable_type'])
+_FIELDTYPE.fields_by_name['iterable_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['map_type'])
+_FIELDTYPE.fields_by_name['map_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['row_type'])
+_FIELDTYPE.fields_by_name['row_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_FIELDTYPE.oneofs_by_name['type_info'].fields.append(
+  _FIELDTYPE.fields_by_name['logical_type'])
+_FIELDTYPE.fields_by_name['logical_type'].containing_oneof = _FIELDTYPE.oneofs_by_name['type_info']
+_ARRAYTYPE.fields_by_name['element_type'].message_type = _FIELDTYPE
+_ITERABLETYPE.fields_by_name['element_type'].message_type = _FIELDTYPE
+_MAPTYPE.fields_by_name['key_type'].message_type = _FIELDTYPE
+_MAPTYPE.fields_by_name['value_type'].message_type = _FIELDTYPE
+_ROWTYPE.fields_by_name['schema'].message_type = _SCHEMA
+_LOGICALTYPE.fields_by_name['representation'].message_type = _FIELDTYPE
+_LOGICALTYPE.fields_by_name['argument_type'].message_type = _FIELDTYPE
+_LOGICALTYPE.fields_by_name['argument'].message_type = _FIELDVALUE
+_OPTION.fields_by_name['type'].message_type = _FIELDTYPE
+_OPTION.fields_by_name['value'].message_type = _FIELDVALUE
+_ROW.fields_by_name['values'].message_type = _FIELDVALUE
+_FIELDVALUE.fields_by_name['atomic_value'].message_type = _ATOMICTYPEVALUE
+_FIELDVALUE.fields_by_name['array_value'].message_type = _ARRAYTYPEVALUE
+_FIELDVALUE.fields_by_name['iterable_value'].message_type = _ITERABLETYPEVALUE
+_FIELDVALUE.fields_by_name['map_value'].message_type = _MAPTYPEVALUE
+_FIELDVALUE.fields_by_name['row_value'].message_type = _ROW
+_FIELDVALUE.fields_by_name['logical_type_value'].message_type = _LOGICALTYPEVALUE
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['atomic_value'])
+_FIELDVALUE.fields_by_name['atomic_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['array_value'])
+_FIELDVALUE.fields_by_name['array_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['iterable_value'])
+_FIELDVALUE.fields_by_name['iterable_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['map_value'])
+_FIELDVALUE.fields_by_name['map_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['row_value'])
+_FIELDVALUE.fields_by_name['row_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_FIELDVALUE.oneofs_by_name['field_value'].fields.append(
+  _FIELDVALUE.fields_by_name['logical_type_value'])
+_FIELDVALUE.fields_by_name['logical_type_value'].containing_oneof = _FIELDVALUE.oneofs_by_name['field_value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['byte'])
+_ATOMICTYPEVALUE.fields_by_name['byte'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['int16'])
+_ATOMICTYPEVALUE.fields_by_name['int16'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['int32'])
+_ATOMICTYPEVALUE.fields_by_name['int32'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['int64'])
+_ATOMICTYPEVALUE.fields_by_name['int64'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['float'])
+_ATOMICTYPEVALUE.fields_by_name['float'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['double'])
+_ATOMICTYPEVALUE.fields_by_name['double'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['string'])
+_ATOMICTYPEVALUE.fields_by_name['string'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['boolean'])
+_ATOMICTYPEVALUE.fields_by_name['boolean'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ATOMICTYPEVALUE.oneofs_by_name['value'].fields.append(
+  _ATOMICTYPEVALUE.fields_by_name['bytes'])
+_ATOMICTYPEVALUE.fields_by_name['bytes'].containing_oneof = _ATOMICTYPEVALUE.oneofs_by_name['value']
+_ARRAYTYPEVALUE.fields_by_name['element'].message_type = _FIELDVALUE
+_ITERABLETYPEVALUE.fields_by_name['element'].message_type = _FIELDVALUE
+_MAPTYPEVALUE.fields_by_name['entries'].message_type = _MAPTYPEENTRY
+_MAPTYPEENTRY.fields_by_name['key'].message_type = _FIELDVALUE
+_MAPTYPEENTRY.fields_by_name['value'].message_type = _FIELDVALUE
+_LOGICALTYPEVALUE.fields_by_name['value'].message_type = _FIELDVALUE
+DESCRIPTOR.message_types_by_name['Schema'] = _SCHEMA
+DESCRIPTOR.message_types_by_name['Field'] = _FIELD
+DESCRIPTOR.message_types_by_name['FieldType'] = _FIELDTYPE
+DESCRIPTOR.message_types_by_name['ArrayType'] = _ARRAYTYPE
+DESCRIPTOR.message_types_by_name['IterableType'] = _ITERABLETYPE
+DESCRIPTOR.message_types_by_name['MapType'] = _MAPTYPE
+DESCRIPTOR.message_types_by_name['RowType'] = _ROWTYPE
+DESCRIPTOR.message_types_by_name['LogicalType'] = _LOGICALTYPE
+DESCRIPTOR.message_types_by_name['Option'] = _OPTION
+DESCRIPTOR.message_types_by_name['Row'] = _ROW
+DESCRIPTOR.message_types_by_name['FieldValue'] = _FIELDVALUE
+DESCRIPTOR.message_types_by_name['AtomicTypeValue'] = _ATOMICTYPEVALUE
+DESCRIPTOR.message_types_by_name['ArrayTypeValue'] = _ARRAYTYPEVALUE
+DESCRIPTOR.message_types_by_name['IterableTypeValue'] = _ITERABLETYPEVALUE
+DESCRIPTOR.message_types_by_name['MapTypeValue'] = _MAPTYPEVALUE
+DESCRIPTOR.message_types_by_name['MapTypeEntry'] = _MAPTYPEENTRY
+DESCRIPTOR.message_types_by_name['LogicalTypeValue'] = _LOGICALTYPEVALUE
+DESCRIPTOR.enum_types_by_name['AtomicType'] = _ATOMICTYPE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Schema = _reflection.GeneratedProtocolMessageType('Schema', (_message.Message,), {
+  'DESCRIPTOR' : _SCHEMA,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Schema)
+  })
+_sym_db.RegisterMessage(Schema)
+
+Field = _reflection.GeneratedProtocolMessageType('Field', (_message.Message,), {
+  'DESCRIPTOR' : _FIELD,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Field)
+  })
+_sym_db.RegisterMessage(Field)
+
+FieldType = _reflection.GeneratedProtocolMessageType('FieldType', (_message.Message,), {
+  'DESCRIPTOR' : _FIELDTYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.FieldType)
+  })
+_sym_db.RegisterMessage(FieldType)
+
+ArrayType = _reflection.GeneratedProtocolMessageType('ArrayType', (_message.Message,), {
+  'DESCRIPTOR' : _ARRAYTYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArrayType)
+  })
+_sym_db.RegisterMessage(ArrayType)
+
+IterableType = _reflection.GeneratedProtocolMessageType('IterableType', (_message.Message,), {
+  'DESCRIPTOR' : _ITERABLETYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IterableType)
+  })
+_sym_db.RegisterMessage(IterableType)
+
+MapType = _reflection.GeneratedProtocolMessageType('MapType', (_message.Message,), {
+  'DESCRIPTOR' : _MAPTYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MapType)
+  })
+_sym_db.RegisterMessage(MapType)
+
+RowType = _reflection.GeneratedProtocolMessageType('RowType', (_message.Message,), {
+  'DESCRIPTOR' : _ROWTYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.RowType)
+  })
+_sym_db.RegisterMessage(RowType)
+
+LogicalType = _reflection.GeneratedProtocolMessageType('LogicalType', (_message.Message,), {
+  'DESCRIPTOR' : _LOGICALTYPE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.LogicalType)
+  })
+_sym_db.RegisterMessage(LogicalType)
+
+Option = _reflection.GeneratedProtocolMessageType('Option', (_message.Message,), {
+  'DESCRIPTOR' : _OPTION,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Option)
+  })
+_sym_db.RegisterMessage(Option)
+
+Row = _reflection.GeneratedProtocolMessageType('Row', (_message.Message,), {
+  'DESCRIPTOR' : _ROW,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Row)
+  })
+_sym_db.RegisterMessage(Row)
+
+FieldValue = _reflection.GeneratedProtocolMessageType('FieldValue', (_message.Message,), {
+  'DESCRIPTOR' : _FIELDVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.FieldValue)
+  })
+_sym_db.RegisterMessage(FieldValue)
+
+AtomicTypeValue = _reflection.GeneratedProtocolMessageType('AtomicTypeValue', (_message.Message,), {
+  'DESCRIPTOR' : _ATOMICTYPEVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.AtomicTypeValue)
+  })
+_sym_db.RegisterMessage(AtomicTypeValue)
+
+ArrayTypeValue = _reflection.GeneratedProtocolMessageType('ArrayTypeValue', (_message.Message,), {
+  'DESCRIPTOR' : _ARRAYTYPEVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArrayTypeValue)
+  })
+_sym_db.RegisterMessage(ArrayTypeValue)
+
+IterableTypeValue = _reflection.GeneratedProtocolMessageType('IterableTypeValue', (_message.Message,), {
+  'DESCRIPTOR' : _ITERABLETYPEVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IterableTypeValue)
+  })
+_sym_db.RegisterMessage(IterableTypeValue)
+
+MapTypeValue = _reflection.GeneratedProtocolMessageType('MapTypeValue', (_message.Message,), {
+  'DESCRIPTOR' : _MAPTYPEVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MapTypeValue)
+  })
+_sym_db.RegisterMessage(MapTypeValue)
+
+MapTypeEntry = _reflection.GeneratedProtocolMessageType('MapTypeEntry', (_message.Message,), {
+  'DESCRIPTOR' : _MAPTYPEENTRY,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MapTypeEntry)
+  })
+_sym_db.RegisterMessage(MapTypeEntry)
+
+LogicalTypeValue = _reflection.GeneratedProtocolMessageType('LogicalTypeValue', (_message.Message,), {
+  'DESCRIPTOR' : _LOGICALTYPEVALUE,
+  '__module__' : 'schema_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.LogicalTypeValue)
+  })
+_sym_db.RegisterMessage(LogicalTypeValue)
+
+
+DESCRIPTOR._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: standard_window_fns.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='standard_window_fns.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_options=b'\n!org.apache.beam.model.pipeline.v1B\021StandardWindowFnsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x19standard_window_fns.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"V\n\x14GlobalWindowsPayload\">\n\x04\x45num\x12\x36\n\nPROPERTIES\x10\x00\x1a&\xa2\xb4\xfa\xc2\x05 beam:window_fn:global_windows:v1\"\xa9\x01\n\x13\x46ixedWindowsPayload\x12\'\n\x04size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x06offset\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"=\n\x04\x45num\x12\x35\n\nPROPERTIES\x10\x00\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:window_fn:fixed_windows:v1\"\xd8\x01\n\x15SlidingWindowsPayload\x12\'\n\x04size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x06offset\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12)\n\x06period\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\"?\n\x04\x45num\x12\x37\n\nPROPERTIES\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:window_fn:sliding_windows:v1\"\x85\x01\n\x15SessionWindowsPayload\x12+\n\x08gap_size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\"?\n\x04\x45num\x12\x37\n\nPROPERTIES\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:window_fn:session_windows:v1B}\n!org.apache.beam.model.pipeline.v1B\x11StandardWindowFnsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3'
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,google_dot_protobuf_dot_duration__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
+
+
+
+_GLOBALWINDOWSPAYLOAD_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.GlobalWindowsPayload.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PROPERTIES', index=0, number=0,
+      serialized_options=b'\242\264\372\302\005 beam:window_fn:global_windows:v1',
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=176,
+  serialized_end=238,
+)
+_sym_db.RegisterEnumDescriptor(_GLOBALWINDOWSPAYLOAD_ENUM)
+
+_FIXEDWINDOWSPAYLOAD_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.FixedWindowsPayload.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PROPERTIES', index=0, number=0,
+      serialized_options=b'\242\264\372\302\005\037beam:window_fn:fixed_windows:v1',
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=349,
+  serialized_end=410,
+)
+_sym_db.RegisterEnumDescriptor(_FIXEDWINDOWSPAYLOAD_ENUM)
+
+_SLIDINGWINDOWSPAYLOAD_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.SlidingWindowsPayload.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PROPERTIES', index=0, number=0,
+      serialized_options=b'\242\264\372\302\005!beam:window_fn:sliding_windows:v1',
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=566,
+  serialized_end=629,
+)
+_sym_db.RegisterEnumDescriptor(_SLIDINGWINDOWSPAYLOAD_ENUM)
+
+_SESSIONWINDOWSPAYLOAD_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.SessionWindowsPayload.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PROPERTIES', index=0, number=0,
+      serialized_options=b'\242\264\372\302\005!beam:window_fn:session_windows:v1',
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=702,
+  serialized_end=765,
+)
+_sym_db.RegisterEnumDescriptor(_SESSIONWINDOWSPAYLOAD_ENUM)
+
+
+_GLOBALWINDOWSPAYLOAD = _descriptor.Descriptor(
+  name='GlobalWindowsPayload',
+  full_name='org.apache.beam.model.pipeline.v1.GlobalWindowsPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _GLOBALWINDOWSPAYLOAD_ENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=152,
+  serialized_end=238,
+)
+
+
+_FIXEDWINDOWSPAYLOAD = _descriptor.Descriptor(
+  name='FixedWindowsPayload',
+  full_name='org.apache.beam.model.pipeline.v1.FixedWindowsPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='size', full_name='org.apache.beam.model.pipeline.v1.FixedWindowsPayload.size', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='org.apache.beam.model.pipeline.v1.FixedWindowsPayload.offset', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _FIXEDWINDOWSPAYLOAD_ENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=241,
+  serialized_end=410,
+)
+
+
+_SLIDINGWINDOWSPAYLOAD = _descriptor.Descriptor(
+  name='SlidingWindowsPayload',
+  full_name='org.apache.beam.model.pipeline.v1.SlidingWindowsPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='size', full_name='org.apache.beam.model.pipeline.v1.SlidingWindowsPayload.size', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='org.apache.beam.model.pipeline.v1.SlidingWindowsPayload.offset', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='period', full_name='org.apache.beam.model.pipeline.v1.SlidingWindowsPayload.period', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _SLIDINGWINDOWSPAYLOAD_ENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=413,
+  serialized_end=629,
+)
+
+
+_SESSIONWINDOWSPAYLOAD = _descriptor.Descriptor(
+  name='SessionWindowsPayload',
+  full_name='org.apache.beam.model.pipeline.v1.SessionWindowsPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='gap_size', full_name='org.apache.beam.model.pipeline.v1.SessionWindowsPayload.gap_size', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _SESSIONWINDOWSPAYLOAD_ENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=632,
+  serialized_end=765,
+)
+
+_GLOBALWINDOWSPAYLOAD_ENUM.containing_type = _GLOBALWINDOWSPAYLOAD
+_FIXEDWINDOWSPAYLOAD.fields_by_name['size'].message_type = google_dot_protobuf_dot_duration__pb2._DURATION
+_FIXEDWINDOWSPAYLOAD.fields_by_name['offset'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_FIXEDWINDOWSPAYLOAD_ENUM.containing_type = _FIXEDWINDOWSPAYLOAD
+_SLIDINGWINDOWSPAYLOAD.fields_by_name['size'].message_type = google_dot_protobuf_dot_duration__pb2._DURATION
+_SLIDINGWINDOWSPAYLOAD.fields_by_name['offset'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_SLIDINGWINDOWSPAYLOAD.fields_by_name['period'].message_type = google_dot_protobuf_dot_duration__pb2._DURATION
+_SLIDINGWINDOWSPAYLOAD_ENUM.containing_type = _SLIDINGWINDOWSPAYLOAD
+_SESSIONWINDOWSPAYLOAD.fields_by_name['gap_size'].message_type = google_dot_protobuf_dot_duration__pb2._DURATION
+_SESSIONWINDOWSPAYLOAD_ENUM.containing_type = _SESSIONWINDOWSPAYLOAD
+DESCRIPTOR.message_types_by_name['GlobalWindowsPayload'] = _GLOBALWINDOWSPAYLOAD
+DESCRIPTOR.message_types_by_name['FixedWindowsPayload'] = _FIXEDWINDOWSPAYLOAD
+DESCRIPTOR.message_types_by_name['SlidingWindowsPayload'] = _SLIDINGWINDOWSPAYLOAD
+DESCRIPTOR.message_types_by_name['SessionWindowsPayload'] = _SESSIONWINDOWSPAYLOAD
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+GlobalWindowsPayload = _reflection.GeneratedProtocolMessageType('GlobalWindowsPayload', (_message.Message,), {
+  'DESCRIPTOR' : _GLOBALWINDOWSPAYLOAD,
+  '__module__' : 'standard_window_fns_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.GlobalWindowsPayload)
+  })
+_sym_db.RegisterMessage(GlobalWindowsPayload)
+
+FixedWindowsPayload = _reflection.GeneratedProtocolMessageType('FixedWindowsPayload', (_message.Message,), {
+  'DESCRIPTOR' : _FIXEDWINDOWSPAYLOAD,
+  '__module__' : 'standard_window_fns_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.FixedWindowsPayload)
+  })
+_sym_db.RegisterMessage(FixedWindowsPayload)
+
+SlidingWindowsPayload = _reflection.GeneratedProtocolMessageType('SlidingWindowsPayload', (_message.Message,), {
+  'DESCRIPTOR' : _SLIDINGWINDOWSPAYLOAD,
+  '__module__' : 'standard_window_fns_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SlidingWindowsPayload)
+  })
+_sym_db.RegisterMessage(SlidingWindowsPayload)
+
+SessionWindowsPayload = _reflection.GeneratedProtocolMessageType('SessionWindowsPayload', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONWINDOWSPAYLOAD,
+  '__module__' : 'standard_window_fns_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SessionWindowsPayload)
+  })
+_sym_db.RegisterMessage(SessionWindowsPayload)
+
+
+DESCRIPTOR._options = None
+_GLOBALWINDOWSPAYLOAD_ENUM.values_by_name["PROPERTIES"]._options = None
+_FIXEDWINDOWSPAYLOAD_ENUM.values_by_name["PROPERTIES"]._options = None
+_SLIDINGWINDOWSPAYLOAD_ENUM.values_by_name["PROPERTIES"]._options = None
+_SESSIONWINDOWSPAYLOAD_ENUM.values_by_name["PROPERTIES"]._options = None
+# @@protoc_insertion_point(module_scope)
@@ -38,17 +38,83 @@ deterministic replayable recorded events until they are invalidated.
 
 # pytype: skip-file
 
+import contextlib
+import hashlib
 import logging
+import sched
 import threading
 import time
 
 import apache_beam as beam
+from apache_beam.runners import pipeline_context
 from apache_beam.runners.interactive import interactive_environment as ie
+from apache_beam.runners.interactive import utils
 from apache_beam.runners.interactive.caching import streaming_cache
 from apache_beam.runners.runner import PipelineState
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size in bytes of the digest tracked for each source in a source signature.
+_SIGNATURE_DIGEST_SIZE = 16
+
+# Holds the traversals of user pipelines done within the current top-level call
+# of the thread, see _traversal_scope.
+_TRAVERSALS = threading.local()
+
+
+class _ConditionCheckScheduler(object):
+  """Runs the condition checks of all background source recording jobs on a
+  single daemon thread.
+
+  The thread is started on demand and exits once there is no more pending
+  check, so the number of threads doesn't grow with the number of jobs.
+  """
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._wakeup = threading.Event()
+    self._scheduler = sched.scheduler(time.monotonic, self._delay)
+    self._thread = None
+
+  def _delay(self, timeout):
+    # Wakes up early when a new check is entered so that it doesn't wait behind
+    # a check scheduled further in the future.
+    self._wakeup.wait(timeout)
+    self._wakeup.clear()
+
+  def enter(self, delay, action):
+    """Schedules the action to be run after delay seconds. Returns an event
+    that can be passed to cancel()."""
+    with self._lock:
+      event = self._scheduler.enter(delay, 0, action)
+      if self._thread is None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    self._wakeup.set()
+    return event
+
+  def cancel(self, event):
+    """Cancels a scheduled event. Noop if the event has already been run."""
+    try:
+      self._scheduler.cancel(event)
+    except ValueError:
+      pass
+
+  def _run(self):
+    utils.set_timer_slack_of_current_thread()
+    while True:
+      try:
+        self._scheduler.run()
+      except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            'Failed to check conditions of a background caching job.')
+      with self._lock:
+        if self._scheduler.empty():
+          self._thread = None
+          return
+
+
+_CONDITION_CHECK_SCHEDULER = _ConditionCheckScheduler()
+
 
 class BackgroundCachingJob(object):
   """A simple abstraction that controls necessary components of a timed and
@@ -64,27 +130,46 @@ class BackgroundCachingJob(object):
   In both situations, the background source recording job should be treated as
   done successfully.
   """
-  def __init__(self, pipeline_result, limiters):
+  def __init__(self, pipeline_result, limiters, poll_interval_secs=0.5):
     self._pipeline_result = pipeline_result
     self._result_lock = threading.RLock()
-    self._condition_checker = threading.Thread(
-        target=self._background_caching_job_condition_checker, daemon=True)
+    # Guarded by _result_lock. Set once the job is cancelled so that no more
+    # condition check is scheduled for it.
+    self._cancelled = False
+    self._poll_interval_secs = poll_interval_secs
+    self._scheduled_check = None
 
     # Limiters are checks s.t. if any are triggered then the background caching
     # job gets cancelled.
     self._limiters = limiters
-    self._condition_checker.start()
+    self._schedule_condition_check(0)
 
-  def _background_caching_job_condition_checker(self):
-    while True:
-      with self._result_lock:
-        if PipelineState.is_terminal(self._pipeline_result.state):
-          break
+  def _schedule_condition_check(self, delay):
+    with self._result_lock:
+      if not self._cancelled:
+        self._scheduled_check = _CONDITION_CHECK_SCHEDULER.enter(
+            delay, self._background_caching_job_condition_checker)
 
-      if self._should_end_condition_checker():
-        self.cancel()
-        break
-      time.sleep(0.5)
+  def _background_caching_job_condition_checker(self):
+    with self._result_lock:
+      self._scheduled_check = None
+      if PipelineState.is_terminal(self._pipeline_result.state):
+        return
+
+    if self._should_end_condition_checker():
+      self.cancel()
+      return
+    self._schedule_condition_check(self._secs_until_next_check())
+
+  def _secs_until_next_check(self):
+    # Wakes up right when a limiter is known to trigger instead of waiting for
+    # the next poll.
+    delay = self._poll_interval_secs
+    for l in self._limiters:
+      secs_until_triggered = l.secs_until_triggered()
+      if secs_until_triggered is not None:
+        delay = min(delay, secs_until_triggered)
+    return delay
 
   def _should_end_condition_checker(self):
     return any([l.is_triggered() for l in self._limiters])
@@ -105,6 +190,10 @@ class BackgroundCachingJob(object):
     """Cancels this background source recording job.
     """
     with self._result_lock:
+      self._cancelled = True
+      if self._scheduled_check:
+        _CONDITION_CHECK_SCHEDULER.cancel(self._scheduled_check)
+        self._scheduled_check = None
       if not PipelineState.is_terminal(self._pipeline_result.state):
         try:
           self._pipeline_result.cancel()
@@ -129,6 +218,14 @@ def attempt_to_run_background_caching_job(
   The pipeline result is automatically tracked by Interactive Beam in case
   future cancellation/cleanup is needed.
   """
+  with _traversal_scope():
+    return _attempt_to_run_background_caching_job(
+        runner, user_pipeline, options, limiters)
+
+
+def _attempt_to_run_background_caching_job(
+    runner, user_pipeline, options=None, limiters=None):
+  env = ie.current_env()
   if is_background_caching_job_needed(user_pipeline):
     # Cancel non-terminal jobs if there is any before starting a new one.
     attempt_to_cancel_background_caching_job(user_pipeline)
@@ -137,22 +234,24 @@ def attempt_to_run_background_caching_job(
     # TODO(BEAM-8335): refactor background source recording job logic from
     # pipeline_instrument module to this module and aggregate tests.
     from apache_beam.runners.interactive import pipeline_instrument as instr
+    # The pipeline proto is shared with the source signature extraction above.
     runner_pipeline = beam.pipeline.Pipeline.from_runner_api(
-        user_pipeline.to_runner_api(), runner, options)
-    ie.current_env().add_derived_pipeline(user_pipeline, runner_pipeline)
+        _runner_api(user_pipeline)[0], runner, options)
+    env.add_derived_pipeline(user_pipeline, runner_pipeline)
     background_caching_job_result = beam.pipeline.Pipeline.from_runner_api(
         instr.build_pipeline_instrument(
             runner_pipeline).background_caching_pipeline_proto(),
         runner,
         options).run()
 
-    recording_limiters = (
-        limiters
-        if limiters else ie.current_env().options.capture_control.limiters())
-    ie.current_env().set_background_caching_job(
+    capture_control = env.options.capture_control
+    recording_limiters = limiters if limiters else capture_control.limiters()
+    env.set_background_caching_job(
         user_pipeline,
         BackgroundCachingJob(
-            background_caching_job_result, limiters=recording_limiters))
+            background_caching_job_result,
+            limiters=recording_limiters,
+            poll_interval_secs=capture_control.poll_interval_secs()))
     return True
   return False
 
@@ -163,33 +262,40 @@ def is_background_caching_job_needed(user_pipeline):
   It does several state checks and recording state changes throughout the
   process. It is not idempotent to simplify the usage.
   """
-  job = ie.current_env().get_background_caching_job(user_pipeline)
-  # Checks if the pipeline contains any source that needs to be cached.
-  need_cache = has_source_to_cache(user_pipeline)
+  with _traversal_scope():
+    return _is_background_caching_job_needed(user_pipeline)
+
+
+def _is_background_caching_job_needed(user_pipeline):
+  env = ie.current_env()
+  job = env.get_background_caching_job(user_pipeline)
+  # Checks if the pipeline contains any source that needs to be cached. If not,
+  # skips the expensive source signature check below.
+  if not has_source_to_cache(user_pipeline):
+    return False
   # If this is True, we can invalidate a previous done/running job if there is
-  # one.
+  # one. Always evaluated so that the signature of sources to be recorded by a
+  # new job is tracked.
   cache_changed = is_source_to_cache_changed(user_pipeline)
   # When recording replay is disabled, cache is always needed for recordable
   # sources (if any).
-  if need_cache and not ie.current_env().options.enable_recording_replay:
+  if not env.options.enable_recording_replay:
     from apache_beam.runners.interactive.options import capture_control
     capture_control.evict_captured_data()
     return True
   return (
-      need_cache and
       # Checks if it's the first time running a job from the pipeline.
-      (
-          not job or
-          # Or checks if there is no previous job.
-          # DONE means a previous job has completed successfully and the
-          # cached events might still be valid.
-          not (
-              job.is_done() or
-              # RUNNING means a previous job has been started and is still
-              # running.
-              job.is_running()) or
-          # Or checks if we can invalidate the previous job.
-          cache_changed))
+      not job or
+      # Or checks if there is no previous job.
+      # DONE means a previous job has completed successfully and the
+      # cached events might still be valid.
+      not (
+          job.is_done() or
+          # RUNNING means a previous job has been started and is still
+          # running.
+          job.is_running()) or
+      # Or checks if we can invalidate the previous job.
+      cache_changed)
 
 
 def is_cache_complete(pipeline_id):
@@ -197,8 +303,9 @@ def is_cache_complete(pipeline_id):
 
   """Returns True if the backgrond cache for the given pipeline is done.
   """
-  user_pipeline = ie.current_env().pipeline_id_to_pipeline(pipeline_id)
-  job = ie.current_env().get_background_caching_job(user_pipeline)
+  env = ie.current_env()
+  user_pipeline = env.pipeline_id_to_pipeline(pipeline_id)
+  job = env.get_background_caching_job(user_pipeline)
   is_done = job and job.is_done()
   cache_changed = is_source_to_cache_changed(
       user_pipeline, update_cached_source_signature=False)
@@ -221,17 +328,17 @@ def has_source_to_cache(user_pipeline):
   Throughout the check, if source-to-cache has changed from the last check, it
   also cleans up the invalidated cache early on.
   """
-  from apache_beam.runners.interactive import pipeline_instrument as instr
+  env = ie.current_env()
   # TODO(BEAM-8335): we temporarily only cache replaceable unbounded sources.
   # Add logic for other cacheable sources here when they are available.
-  has_cache = instr.has_unbounded_sources(user_pipeline)
+  has_cache = len(_unbounded_sources(user_pipeline)) > 0
   if has_cache:
-    if not isinstance(ie.current_env().get_cache_manager(user_pipeline,
-                                                         create_if_absent=True),
+    if not isinstance(env.get_cache_manager(user_pipeline,
+                                            create_if_absent=True),
                       streaming_cache.StreamingCache):
 
-      file_based_cm = ie.current_env().get_cache_manager(user_pipeline)
-      ie.current_env().set_cache_manager(
+      file_based_cm = env.get_cache_manager(user_pipeline)
+      env.set_cache_manager(
           streaming_cache.StreamingCache(
               file_based_cm._cache_dir,
               is_cache_complete=is_cache_complete,
@@ -283,16 +390,16 @@ def is_source_to_cache_changed(
   When it's True, there is addition/deletion/mutation of source transforms that
   requires a new background source recording job.
   """
+  env = ie.current_env()
   # By default gets empty set if the user_pipeline is first time seen because
   # we can treat it as adding transforms.
-  recorded_signature = ie.current_env().get_cached_source_signature(
-      user_pipeline)
+  recorded_signature = env.get_cached_source_signature(user_pipeline)
   current_signature = extract_source_to_cache_signature(user_pipeline)
   is_changed = not current_signature.issubset(recorded_signature)
   # The computation of extract_unbounded_source_signature is expensive, track on
   # change by default.
   if is_changed and update_cached_source_signature:
-    options = ie.current_env().options
+    options = env.options
     # No info needed when recording replay is disabled.
     if options.enable_recording_replay:
       if not recorded_signature:
@@ -313,15 +420,22 @@ def is_source_to_cache_changed(
             sizeof_fmt(options.recording_size_limit))
       else:
         _LOGGER.info(
-            'Interactive Beam has detected a new streaming source was '
-            'added to the pipeline. In order for the cached streaming '
-            'data to start at the same time, all recorded data has been '
-            'cleared and a new segment of data will be recorded.')
-
-    ie.current_env().cleanup(user_pipeline)
-    ie.current_env().set_cached_source_signature(
-        user_pipeline, current_signature)
-    ie.current_env().add_user_pipeline(user_pipeline)
+            'Interactive Beam has detected %d new or changed streaming '
+            'source(s) in the pipeline. In order for the cached streaming '
+            'data to start at the same time, the data recorded from the %d '
+            'previously recorded source(s) of the pipeline has been cleared '
+            'and a new segment of data will be recorded from all %d '
+            'source(s).',
+            len(current_signature - recorded_signature),
+            len(recorded_signature),
+            len(current_signature))
+
+    # A new background source recording job records all sources from the same
+    # starting point, so the data recorded from unchanged sources can't be
+    # kept. Only the given pipeline is cleaned up.
+    env.cleanup(user_pipeline)
+    env.set_cached_source_signature(user_pipeline, current_signature)
+    env.add_user_pipeline(user_pipeline)
   return is_changed
 
 
@@ -329,18 +443,76 @@ def extract_source_to_cache_signature(user_pipeline):
   """Extracts a set of signature for sources that need to be cached in the
   user-defined pipeline.
 
-  A signature is a str representation of urn and payload of a source.
+  A signature is a fixed-size digest of the serialized urn and payload of a
+  source, so that the tracked signature doesn't hold on to potentially large
+  payloads.
+
+  Each source transform is serialized with a context of its own, so that the
+  signature reflects the current content of the source without serializing
+  the whole pipeline.
   """
-  from apache_beam.runners.interactive import pipeline_instrument as instr
   # TODO(BEAM-8335): we temporarily only cache replaceable unbounded sources.
   # Add logic for other cacheable sources here when they are available.
-  unbounded_sources_as_applied_transforms = instr.unbounded_sources(
-      user_pipeline)
-  unbounded_sources_as_ptransforms = set(
-      map(lambda x: x.transform, unbounded_sources_as_applied_transforms))
-  _, context = user_pipeline.to_runner_api(return_context=True)
-  signature = set(
-      map(
-          lambda transform: str(transform.to_runner_api(context)),
-          unbounded_sources_as_ptransforms))
-  return signature
+  unbounded_sources_as_ptransforms = {
+      applied.transform
+      for applied in _unbounded_sources(user_pipeline)
+  }
+  return {
+      _digest(
+          transform.to_runner_api(
+              pipeline_context.PipelineContext()).SerializeToString(
+                  deterministic=True))
+      for transform in unbounded_sources_as_ptransforms
+  }
+
+
+@contextlib.contextmanager
+def _traversal_scope():
+  """Memoizes the traversals of user pipelines until the outermost scope of the
+  current thread exits.
+
+  A user pipeline is not mutated within a single top-level call, so the same
+  graph doesn't need to be walked more than once.
+  """
+  if getattr(_TRAVERSALS, 'memo', None) is not None:
+    yield
+    return
+  _TRAVERSALS.memo = {}
+  try:
+    yield
+  finally:
+    _TRAVERSALS.memo = None
+
+
+def _memoize_traversal(kind, user_pipeline, traverse):
+  """Returns traverse(user_pipeline), memoized by the kind of the traversal
+  within the current _traversal_scope if there is one."""
+  memo = getattr(_TRAVERSALS, 'memo', None)
+  if memo is None:
+    return traverse(user_pipeline)
+  key = (kind, str(id(user_pipeline)))
+  if key not in memo:
+    memo[key] = traverse(user_pipeline)
+  return memo[key]
+
+
+def _unbounded_sources(user_pipeline):
+  """Returns the recordable sources of the user pipeline."""
+  from apache_beam.runners.interactive import pipeline_instrument as instr
+  return _memoize_traversal(
+      'unbounded_sources', user_pipeline, instr.unbounded_sources)
+
+
+def _runner_api(user_pipeline):
+  """Returns the pipeline proto of the user pipeline and the context it was
+  built with. The proto is shared, so it must not be mutated."""
+  return _memoize_traversal(
+      'runner_api',
+      user_pipeline,
+      lambda pipeline: pipeline.to_runner_api(return_context=True))
+
+
+def _digest(serialized_source):
+  # type: (bytes) -> bytes
+  return hashlib.blake2b(
+      serialized_source, digest_size=_SIGNATURE_DIGEST_SIZE).digest()
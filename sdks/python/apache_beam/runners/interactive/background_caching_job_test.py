@@ -18,7 +18,9 @@
 """Tests for apache_beam.runners.interactive.background_caching_job."""
 # pytype: skip-file
 
+import time
 import unittest
+from datetime import timedelta
 from unittest.mock import patch
 
 import apache_beam as beam
@@ -30,6 +32,7 @@ from apache_beam.runners.interactive import interactive_beam as ib
 from apache_beam.runners.interactive import interactive_environment as ie
 from apache_beam.runners.interactive import interactive_runner
 from apache_beam.runners.interactive.caching.streaming_cache import StreamingCache
+from apache_beam.runners.interactive.options.capture_limiters import DurationLimiter
 from apache_beam.runners.interactive.testing.mock_ipython import mock_get_ipython
 from apache_beam.runners.interactive.testing.test_cache_manager import FileRecordsBuilder
 from apache_beam.testing.test_stream import TestStream
@@ -124,6 +127,34 @@ class BackgroundCachingJobTest(unittest.TestCase):
         expected_cached_source_signature,
         ie.current_env().get_cached_source_signature(p))
 
+  def test_background_caching_job_polls_at_configured_interval(self):
+    class FakePipelineResult(beam.runners.runner.PipelineResult):
+      def wait_until_finish(self):
+        return
+
+    class FakePipelineRunner(beam.runners.PipelineRunner):
+      def run_pipeline(self, pipeline, options):
+        return FakePipelineResult(beam.runners.runner.PipelineState.RUNNING)
+
+    p = beam.Pipeline(
+        runner=interactive_runner.InteractiveRunner(FakePipelineRunner()),
+        options=PipelineOptions(streaming=True))
+
+    # pylint: disable=possibly-unused-variable
+    elems = p | 'Read' >> beam.io.ReadFromPubSub(subscription=_FOO_PUBSUB_SUB)
+
+    ib.watch(locals())
+
+    _setup_test_streaming_cache(p)
+    ib.options.recording_poll_interval = 7
+    try:
+      p.run()
+    finally:
+      ib.options.recording_poll_interval = 0.5
+    background_caching_job = ie.current_env().get_background_caching_job(p)
+    self.assertEqual(background_caching_job._poll_interval_secs, 7)
+    background_caching_job.cancel()
+
   @patch(
       'apache_beam.runners.interactive.background_caching_job'
       '.has_source_to_cache',
@@ -136,6 +167,52 @@ class BackgroundCachingJobTest(unittest.TestCase):
     p.run()
     self.assertIsNone(ie.current_env().get_background_caching_job(p))
 
+  @patch(
+      'apache_beam.runners.interactive.background_caching_job'
+      '.has_source_to_cache',
+      lambda x: False)
+  def test_source_to_cache_not_checked_when_no_source_to_cache(self):
+    p = beam.Pipeline()
+    with patch('apache_beam.runners.interactive.background_caching_job'
+               '.is_source_to_cache_changed') as mocked_is_changed:
+      self.assertFalse(bcj.is_background_caching_job_needed(p))
+      mocked_is_changed.assert_not_called()
+
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  def test_pipeline_traversed_once_when_checking_background_caching_job(
+      self, cell):
+    with cell:  # Cell 1
+      pipeline = _build_an_empty_stream_pipeline()
+      read_foo = pipeline | 'Read' >> beam.io.ReadFromPubSub(
+          subscription=_FOO_PUBSUB_SUB)
+      ib.watch({'read_foo': read_foo})
+
+    from apache_beam.runners.interactive import pipeline_instrument as instr
+    with patch('apache_beam.runners.interactive.pipeline_instrument'
+               '.unbounded_sources',
+               wraps=instr.unbounded_sources) as mocked_unbounded_sources:
+      self.assertTrue(bcj.is_background_caching_job_needed(pipeline))
+      mocked_unbounded_sources.assert_called_once_with(pipeline)
+
+  def test_user_pipeline_serialized_once_when_starting_background_caching_job(
+      self):
+    class FakePipelineRunner(beam.runners.PipelineRunner):
+      def run_pipeline(self, pipeline, options):
+        return beam.runners.runner.PipelineResult(
+            beam.runners.runner.PipelineState.RUNNING)
+
+    p = _build_an_empty_stream_pipeline()
+    # pylint: disable=possibly-unused-variable
+    elems = p | 'Read' >> beam.io.ReadFromPubSub(subscription=_FOO_PUBSUB_SUB)
+    ib.watch(locals())
+
+    with patch.object(p, 'to_runner_api',
+                      wraps=p.to_runner_api) as mocked_to_runner_api:
+      self.assertTrue(
+          bcj.attempt_to_run_background_caching_job(
+              FakePipelineRunner(), p, options=p.options, limiters=[]))
+      mocked_to_runner_api.assert_called_once_with(return_context=True)
+
   @patch(
       'apache_beam.runners.interactive.background_caching_job'
       '.has_source_to_cache',
@@ -186,6 +263,31 @@ class BackgroundCachingJobTest(unittest.TestCase):
     # A new main job is started so result of the main job is set.
     self.assertIs(main_job_result, ie.current_env().pipeline_result(p))
 
+  def test_cancel_unschedules_condition_check(self):
+    background_caching_job = bcj.BackgroundCachingJob(
+        runner.PipelineResult(runner.PipelineState.RUNNING),
+        limiters=[],
+        poll_interval_secs=3600)
+    background_caching_job.cancel()
+    # No condition check of the cancelled job is left pending.
+    self.assertIsNone(background_caching_job._scheduled_check)
+
+  def test_cancelled_when_duration_limit_is_reached_before_next_poll(self):
+    class CancellablePipelineResult(runner.PipelineResult):
+      def cancel(self):
+        self._state = runner.PipelineState.CANCELLED
+
+    background_caching_job = bcj.BackgroundCachingJob(
+        CancellablePipelineResult(runner.PipelineState.RUNNING),
+        limiters=[DurationLimiter(timedelta(seconds=0.1))],
+        poll_interval_secs=3600)
+    for _ in range(50):
+      if background_caching_job.is_done():
+        break
+      time.sleep(0.1)
+    self.assertEqual(
+        background_caching_job.state, runner.PipelineState.CANCELLED)
+
   @patch('IPython.get_ipython', new_callable=mock_get_ipython)
   def test_source_to_cache_changed_when_pipeline_is_first_time_seen(self, cell):
     with cell:  # Cell 1
@@ -220,6 +322,47 @@ class BackgroundCachingJobTest(unittest.TestCase):
     self.assertTrue(bcj.is_cache_complete(str(id(pipeline))))
     self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
 
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  def test_source_change_logs_number_of_changed_sources(self, cell):
+    with cell:  # Cell 1
+      pipeline = _build_an_empty_stream_pipeline()
+      read_foo = pipeline | 'Read' >> beam.io.ReadFromPubSub(
+          subscription=_FOO_PUBSUB_SUB)
+      ib.watch({'read_foo': read_foo})
+
+    self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
+
+    with cell:  # Cell 2
+      read_bar = pipeline | 'Read' >> beam.io.ReadFromPubSub(
+          subscription=_BAR_PUBSUB_SUB)
+      ib.watch({'read_bar': read_bar})
+
+    with self.assertLogs(bcj._LOGGER, level='INFO') as logs:
+      self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
+    message = logs.output[0]
+    self.assertIn('detected 1 new or changed streaming source(s)', message)
+    self.assertIn('from the 1 previously recorded source(s)', message)
+    self.assertIn('from all 2 source(s)', message)
+
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  def test_source_to_cache_changed_when_source_is_altered_after_checks(
+      self, cell):
+    with cell:  # Cell 1
+      pipeline = _build_an_empty_stream_pipeline()
+      transform = beam.io.ReadFromPubSub(subscription=_FOO_PUBSUB_SUB)
+      read_foo = pipeline | 'Read' >> transform
+      ib.watch({'read_foo': read_foo})
+
+    self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
+    self.assertFalse(bcj.is_source_to_cache_changed(pipeline))
+
+    with cell:  # Cell 2
+      from apache_beam.io.gcp.pubsub import _PubSubSource
+      # Alter the transform without applying any new transform.
+      transform._source = _PubSubSource(subscription=_BAR_PUBSUB_SUB)
+
+    self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
+
   @patch('IPython.get_ipython', new_callable=mock_get_ipython)
   def test_source_to_cache_changed_when_source_is_altered(self, cell):
     with cell:  # Cell 1
@@ -239,6 +382,26 @@ class BackgroundCachingJobTest(unittest.TestCase):
 
     self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
 
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  def test_source_to_cache_changed_when_source_is_mutated_in_place(self, cell):
+    with cell:  # Cell 1
+      pipeline = _build_an_empty_stream_pipeline()
+      transform = beam.io.ReadFromPubSub(subscription=_FOO_PUBSUB_SUB)
+      read_foo = pipeline | 'Read' >> transform
+      ib.watch({'read_foo': read_foo})
+
+    # Sets the signature for current pipeline state.
+    ie.current_env().set_cached_source_signature(
+        pipeline, bcj.extract_source_to_cache_signature(pipeline))
+
+    with cell:  # Cell 2
+      # Mutate the source itself rather than replacing it.
+      transform._source.full_subscription = _BAR_PUBSUB_SUB
+      read_foo_2 = read_foo | 'Map' >> beam.Map(lambda x: x)
+      ib.watch({'read_foo_2': read_foo_2})
+
+    self.assertTrue(bcj.is_source_to_cache_changed(pipeline))
+
   @patch('IPython.get_ipython', new_callable=mock_get_ipython)
   def test_source_to_cache_not_changed_for_same_source(self, cell):
     with cell:  # Cell 1
@@ -220,5 +220,19 @@ class TFRecordBasedCacheManagerTest(
   cache_format = 'tfrecord'
 
 
+class SafeFastPrimitivesCoderTest(unittest.TestCase):
+  def test_round_trip(self):
+    coder = cache.SafeFastPrimitivesCoder()
+    values = [0, -1, 1.5, 'a b=c%d\n', b'\x00\xff', (1, 'x'), {'k': [None]}]
+    for value in values:
+      self.assertEqual(value, coder.decode(coder.encode(value)))
+
+  def test_unquote_to_bytes_not_quoted(self):
+    # Inputs that quote() never produces are decoded by urllib.
+    for value in [b'a=3D', b'a %41 ', 'é%41', b'%4', b'%%41', b'%zz', b'%']:
+      self.assertEqual(
+          cache.unquote_to_bytes(value), cache._unquote_to_bytes(value))
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -338,6 +338,7 @@ class StreamingCache(CacheManager):
     filepath = os.path.join(directory, labels[-1])
     if not os.path.exists(directory):
       os.makedirs(directory)
+    coder = self.load_pcoder(*labels)
     with open(filepath, 'ab') as f:
       for v in values:
         if isinstance(v, (TestStreamFileHeader, TestStreamFileRecord)):
@@ -346,7 +347,7 @@ class StreamingCache(CacheManager):
           raise TypeError(
               'Values given to streaming cache should be either '
               'TestStreamFileHeader or TestStreamFileRecord.')
-        f.write(self.load_pcoder(*labels).encode(val) + b'\n')
+        f.write(coder.encode(val) + b'\n')
 
   def clear(self, *labels):
     directory = os.path.join(self._cache_dir, *labels[:-1])
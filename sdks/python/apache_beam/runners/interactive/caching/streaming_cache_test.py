@@ -344,43 +344,53 @@ class StreamingCacheTest(unittest.TestCase):
     self.assertEqual(actual_events, expected_events)
 
   def test_read_and_write_multiple_outputs(self):
-    """An integration test between the Sink and Source with multiple outputs.
+    """Tests that the StreamingCache reads from multiple cached outputs.
 
-    This tests the funcionatlity that the StreamingCache reads from multiple
-    files and combines them into a single sorted output.
+    This tests the functionality that the StreamingCache reads from multiple
+    files and combines them into a single sorted output. The records mirror
+    what the sinks write for two outputs of a TestStream, the end-to-end path
+    through a pipeline is covered by test_read_and_write.
     """
     LETTERS_TAG = repr(CacheKey('letters', '', '', ''))
     NUMBERS_TAG = repr(CacheKey('numbers', '', '', ''))
 
     # Units here are in seconds.
-    test_stream = (TestStream()
-                   .advance_watermark_to(0, tag=LETTERS_TAG)
-                   .advance_processing_time(5)
-                   .add_elements(['a', 'b', 'c'], tag=LETTERS_TAG)
-                   .advance_watermark_to(10, tag=NUMBERS_TAG)
-                   .advance_processing_time(1)
-                   .add_elements(
-                       [
-                           TimestampedValue('1', 15),
-                           TimestampedValue('2', 15),
-                           TimestampedValue('3', 15)
-                       ],
-                       tag=NUMBERS_TAG)) # yapf: disable
-
-    cache = StreamingCache(cache_dir=None, sample_resolution_sec=1.0)
+    letters = (FileRecordsBuilder(LETTERS_TAG)
+               .advance_processing_time(5)
+               .advance_watermark(watermark_secs=0)
+               .add_element(element='a', event_time_secs=0)
+               .add_element(element='b', event_time_secs=0)
+               .add_element(element='c', event_time_secs=0)
+               .advance_processing_time(1)
+               .advance_watermark(watermark_secs=0)
+               .build()) # yapf: disable
 
-    coder = SafeFastPrimitivesCoder()
+    numbers = (FileRecordsBuilder(NUMBERS_TAG)
+               .advance_processing_time(6)
+               .advance_watermark(watermark_secs=10)
+               .add_element(element='1', event_time_secs=15)
+               .add_element(element='2', event_time_secs=15)
+               .add_element(element='3', event_time_secs=15)
+               .build()) # yapf: disable
 
-    options = StandardOptions(streaming=True)
-    with TestPipeline(options=options) as p:
-      # pylint: disable=expression-not-assigned
-      events = p | test_stream
-      events[LETTERS_TAG] | 'Letters sink' >> cache.sink([LETTERS_TAG])
-      events[NUMBERS_TAG] | 'Numbers sink' >> cache.sink([NUMBERS_TAG])
+    cache = StreamingCache(cache_dir=None, sample_resolution_sec=1.0)
+    cache.write(letters, LETTERS_TAG)
+    cache.write(numbers, NUMBERS_TAG)
 
     reader = cache.read_multiple([[LETTERS_TAG], [NUMBERS_TAG]])
+    coder = coders.FastPrimitivesCoder()
     actual_events = list(reader)
 
+    def element_event(element, timestamp, tag):
+      return TestStreamPayload.Event(
+          element_event=TestStreamPayload.Event.AddElements(
+              elements=[
+                  TestStreamPayload.TimestampedElement(
+                      encoded_element=coder.encode(element),
+                      timestamp=timestamp)
+              ],
+              tag=tag))
+
     # Units here are in microseconds.
     expected_events = [
         TestStreamPayload.Event(
@@ -389,17 +399,9 @@ class StreamingCacheTest(unittest.TestCase):
         TestStreamPayload.Event(
             watermark_event=TestStreamPayload.Event.AdvanceWatermark(
                 new_watermark=0, tag=LETTERS_TAG)),
-        TestStreamPayload.Event(
-            element_event=TestStreamPayload.Event.AddElements(
-                elements=[
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('a'), timestamp=0),
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('b'), timestamp=0),
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('c'), timestamp=0),
-                ],
-                tag=LETTERS_TAG)),
+        element_event('a', 0, LETTERS_TAG),
+        element_event('b', 0, LETTERS_TAG),
+        element_event('c', 0, LETTERS_TAG),
         TestStreamPayload.Event(
             processing_time_event=TestStreamPayload.Event.AdvanceProcessingTime(
                 advance_duration=1 * 10**6)),
@@ -409,20 +411,9 @@ class StreamingCacheTest(unittest.TestCase):
         TestStreamPayload.Event(
             watermark_event=TestStreamPayload.Event.AdvanceWatermark(
                 new_watermark=0, tag=LETTERS_TAG)),
-        TestStreamPayload.Event(
-            element_event=TestStreamPayload.Event.AddElements(
-                elements=[
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('1'), timestamp=15 *
-                        10**6),
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('2'), timestamp=15 *
-                        10**6),
-                    TestStreamPayload.TimestampedElement(
-                        encoded_element=coder.encode('3'), timestamp=15 *
-                        10**6),
-                ],
-                tag=NUMBERS_TAG)),
+        element_event('1', 15 * 10**6, NUMBERS_TAG),
+        element_event('2', 15 * 10**6, NUMBERS_TAG),
+        element_event('3', 15 * 10**6, NUMBERS_TAG),
     ]
 
     self.assertListEqual(actual_events, expected_events)
@@ -22,13 +22,19 @@ Only works with Python 3.5+.
 """
 # pytype: skip-file
 
-import base64
+import asyncio
+import binascii
 import datetime
+import functools
+import hashlib
 import html
 import logging
-from datetime import timedelta
+import string
+import threading
 
+import pandas as pd
 from dateutil import tz
+from pandas.api.types import infer_dtype
 
 from apache_beam.runners.interactive import interactive_environment as ie
 from apache_beam.runners.interactive.utils import elements_to_df
@@ -42,8 +48,9 @@ try:
   from IPython.core.display import display  # pylint: disable=import-error
   from IPython.core.display import display_javascript  # pylint: disable=import-error
   from facets_overview.generic_feature_statistics_generator import GenericFeatureStatisticsGenerator  # pylint: disable=import-error
-  from timeloop import Timeloop  # pylint: disable=import-error
 
+  # The generator is stateless, so a single instance is shared by all overviews.
+  _GFSG = GenericFeatureStatisticsGenerator()
   if get_ipython():
     _pcoll_visualization_ready = True
   else:
@@ -51,8 +58,53 @@ try:
 except ImportError:
   _pcoll_visualization_ready = False
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# The event loop refreshing dynamic plotting visualizations, see
+# _refresh_event_loop.
+_REFRESH_LOOP = None
+_REFRESH_LOOP_LOCK = threading.Lock()
+
+# Names of the columns holding the window info of elements, see elements_to_df.
+_WINDOW_INFO_COLUMNS = ('event_time', 'windows', 'pane_info')
+
+
+class _PrecompiledTemplate(object):
+  """A str.format template parsed once so that formatting it only substitutes
+  the replacement fields instead of re-scanning the whole template.
+
+  Only supports keyword replacement fields without conversion or format spec.
+  """
+  def __init__(self, template):
+    # type: (str) -> None
+
+    # Literal fragments (with escaped braces already resolved) interleaved with
+    # the names of replacement fields. Field names are wrapped in tuples to be
+    # distinguished from literal fragments.
+    self._parts = []
+    for literal, field_name, format_spec, conversion in (
+        string.Formatter().parse(template)):
+      if literal:
+        self._parts.append(literal)
+      if field_name is not None:
+        if not field_name.isidentifier() or format_spec or conversion:
+          raise ValueError(
+              'Unsupported replacement field {{{}}} in template.'.format(
+                  field_name))
+        self._parts.append((field_name, ))
+
+  def format(self, **kwargs):
+    # type: (**Any) -> str
+    return ''.join(
+        str(kwargs[part[0]]) if isinstance(part, tuple) else part
+        for part in self._parts)
+
+
 _CSS = """
             <style>
             .p-Widget.jp-OutputPrompt.jp-OutputArea-prompt:empty {{
@@ -64,7 +116,8 @@ _CSS = """
               border: 0;
             }}
             </style>"""
-_DIVE_SCRIPT_TEMPLATE = """
+_DIVE_SCRIPT_TEMPLATE = _PrecompiledTemplate(
+    """
             try {{
               document
                 .getElementById("{display_id}")
@@ -73,8 +126,9 @@ _DIVE_SCRIPT_TEMPLATE = """
                 .data = {jsonstr};
             }} catch (e) {{
               // NOOP when the user has cleared the output from the notebook.
-            }}"""
-_DIVE_HTML_TEMPLATE = _CSS + """
+            }}""")
+_DIVE_HTML_TEMPLATE = _PrecompiledTemplate(
+    _CSS + """
             <iframe id={display_id} style="border:none" width="100%" height="600px"
               srcdoc='
                 <script src="https://cdnjs.cloudflare.com/ajax/libs/webcomponentsjs/1.3.3/webcomponents-lite.js"></script>
@@ -84,8 +138,9 @@ _DIVE_HTML_TEMPLATE = _CSS + """
                   document.getElementById("{display_id}").data = {jsonstr};
                 </script>
               '>
-            </iframe>"""
-_OVERVIEW_SCRIPT_TEMPLATE = """
+            </iframe>""")
+_OVERVIEW_SCRIPT_TEMPLATE = _PrecompiledTemplate(
+    """
               try {{
                 document
                   .getElementById("{display_id}")
@@ -94,8 +149,9 @@ _OVERVIEW_SCRIPT_TEMPLATE = """
                   .protoInput = "{protostr}";
               }} catch (e) {{
                 // NOOP when the user has cleared the output from the notebook.
-              }}"""
-_OVERVIEW_HTML_TEMPLATE = _CSS + """
+              }}""")
+_OVERVIEW_HTML_TEMPLATE = _PrecompiledTemplate(
+    _CSS + """
             <iframe id={display_id} style="border:none" width="100%" height="600px"
               srcdoc='
                 <script src="https://cdnjs.cloudflare.com/ajax/libs/webcomponentsjs/1.3.3/webcomponents-lite.js"></script>
@@ -105,7 +161,7 @@ _OVERVIEW_HTML_TEMPLATE = _CSS + """
                   document.getElementById("{display_id}").protoInput = "{protostr}";
                 </script>
               '>
-            </iframe>"""
+            </iframe>""")
 _DATATABLE_INITIALIZATION_CONFIG = """
             bAutoWidth: false,
             columns: {columns},
@@ -122,7 +178,8 @@ _DATATABLE_INITIALIZATION_CONFIG = """
                 "title": ""
               }}
             ]"""
-_DATAFRAME_SCRIPT_TEMPLATE = """
+_DATAFRAME_SCRIPT_TEMPLATE = _PrecompiledTemplate(
+    """
             var dt;
             if ($.fn.dataTable.isDataTable("#{table_id}")) {{
               dt = $("#{table_id}").dataTable();
@@ -136,17 +193,22 @@ _DATAFRAME_SCRIPT_TEMPLATE = """
             dt.api()
               .clear()
               .rows.add({data_as_rows})
-              .draw('full-hold');"""
-_DATAFRAME_PAGINATION_TEMPLATE = _CSS + """
+              .draw('full-hold');""")
+_DATAFRAME_PAGINATION_TEMPLATE = _PrecompiledTemplate(
+    _CSS + """
             <link rel="stylesheet" href="https://cdn.datatables.net/1.10.20/css/jquery.dataTables.min.css">
             <table id="{table_id}" class="display" style="display:block"></table>
             <script>
               {script_in_jquery_with_datatable}
-            </script>"""
-_NO_DATA_TEMPLATE = _CSS + """
-            <div id="no_data_{id}">No data to display.</div>"""
-_NO_DATA_REMOVAL_SCRIPT = """
-            $("#no_data_{id}").remove();"""
+            </script>""")
+_NO_DATA_TEMPLATE = _PrecompiledTemplate(
+    _CSS + """
+            <div id="no_data_{id}">No data to display.</div>""")
+_NO_DATA_REMOVAL_SCRIPT = _PrecompiledTemplate(
+    """
+            $("#no_data_{id}").remove();""")
+_JQUERY_WITH_DATATABLE_TEMPLATE = _PrecompiledTemplate(
+    ie._JQUERY_WITH_DATATABLE_TEMPLATE)
 
 
 def visualize(
@@ -200,40 +262,115 @@ def visualize(
     return None
 
   if dynamic_plotting_interval:
-    # Disables the verbose logging from timeloop.
-    logging.getLogger('timeloop').disabled = True
-    tl = Timeloop()
-
-    def dynamic_plotting(stream, pv, tl, include_window_info, display_facets):
-      @tl.job(interval=timedelta(seconds=dynamic_plotting_interval))
-      def continuous_update_display():  # pylint: disable=unused-variable
-        # Always creates a new PCollVisualization instance when the
-        # PCollection materialization is being updated and dynamic
-        # plotting is in-process.
-        # PCollectionVisualization created at this level doesn't need dynamic
-        # plotting interval information when instantiated because it's already
-        # in dynamic plotting logic.
-        updated_pv = PCollectionVisualization(
-            stream,
-            include_window_info=include_window_info,
-            display_facets=display_facets,
-            element_type=element_type)
-        updated_pv.display(updating_pv=pv)
+    handle = _DynamicPlotting(
+        stream,
+        pv,
+        dynamic_plotting_interval,
+        include_window_info=include_window_info,
+        display_facets=display_facets,
+        element_type=element_type)
+    handle.start()
+    return handle
+  return None
+
 
+def _refresh_event_loop():
+  """Returns the event loop that refreshes all dynamic plotting visualizations.
+
+  The loop runs in a single daemon thread started on first use so that the
+  visualizations keep updating while the notebook cell blocks, e.g., in
+  interactive_beam.show waiting for the pipeline to finish.
+  """
+  global _REFRESH_LOOP
+  with _REFRESH_LOOP_LOCK:
+    if _REFRESH_LOOP is None:
+      loop = asyncio.new_event_loop()
+      threading.Thread(
+          target=loop.run_forever,
+          name='pcoll_visualization_refresh',
+          daemon=True).start()
+      _REFRESH_LOOP = loop
+    return _REFRESH_LOOP
+
+
+class _DynamicPlotting(object):
+  """A handle to the dynamic plotting of a PCollectionVisualization.
+
+  The visualization is refreshed every interval seconds by a task on the shared
+  refresh event loop until the stream will not yield new elements or stop() is
+  invoked. A refresh taking longer than the interval delays the next one instead
+  of overlapping with it, and a refresh is a noop when the recorded data has not
+  changed since the last rendering, see PCollectionVisualization.display.
+  """
+  def __init__(
+      self,
+      stream,
+      pv,
+      interval,
+      include_window_info=False,
+      display_facets=False,
+      element_type=None):
+    self._stream = stream
+    self._pv = pv
+    self._interval = interval
+    self._include_window_info = include_window_info
+    self._display_facets = display_facets
+    self._element_type = element_type
+    self._stopped = threading.Event()
+    self._future = None
+
+  def start(self):
+    self._future = asyncio.run_coroutine_threadsafe(
+        self._refresh_loop(), _refresh_event_loop())
+
+  def stop(self):
+    """Stops the dynamic plotting. Excessive stops are ignored."""
+    self._stopped.set()
+    if self._future:
+      self._future.cancel()
+
+  def is_stopped(self):
+    return self._stopped.is_set()
+
+  async def _refresh_loop(self):
+    try:
+      while not self._stopped.is_set():
+        await asyncio.sleep(self._interval)
+        if self._stopped.is_set():
+          break
+        # The termination is checked before the refresh, so that the refresh
+        # displays all the data recorded before the termination.
+        is_terminated = ie.current_env().is_terminated(
+            self._stream.pcoll.pipeline)
+        self._refresh()
         # Stop updating the visualizations as soon as the stream will not yield
-        # new elements.
-        if stream.is_done():
-          try:
-            tl.stop()
-          except RuntimeError:
-            # The job can only be stopped once. Ignore excessive stops.
-            pass
-
-      tl.start()
-      return tl
-
-    return dynamic_plotting(stream, pv, tl, include_window_info, display_facets)
-  return None
+        # new elements. A refresh skipped for unchanged recorded data doesn't
+        # read the stream and thus doesn't mark the stream as done.
+        if is_terminated or self._stream.is_done():
+          break
+    except asyncio.CancelledError:
+      # Stopping cancels the loop, which isn't a failure. CancelledError is an
+      # Exception before Python 3.8.
+      raise
+    except Exception:  # pylint: disable=broad-except
+      _LOGGER.exception(
+          'Failed to update the visualization of %s.', self._stream.var)
+    finally:
+      self._stopped.set()
+
+  def _refresh(self):
+    # Always creates a new PCollVisualization instance when the
+    # PCollection materialization is being updated and dynamic
+    # plotting is in-process.
+    # PCollectionVisualization created at this level doesn't need dynamic
+    # plotting interval information when instantiated because it's already
+    # in dynamic plotting logic.
+    updated_pv = PCollectionVisualization(
+        self._stream,
+        include_window_info=self._include_window_info,
+        display_facets=self._display_facets,
+        element_type=self._element_type)
+    updated_pv.display(updating_pv=self._pv)
 
 
 class PCollectionVisualization(object):
@@ -259,14 +396,42 @@ class PCollectionVisualization(object):
     self._pcoll_var = stream.var
     if not self._pcoll_var:
       self._pcoll_var = 'Value'
-    obfuscated_id = stream.display_id(id(self))
-    self._dive_display_id = 'facets_dive_{}'.format(obfuscated_id)
-    self._overview_display_id = 'facets_overview_{}'.format(obfuscated_id)
-    self._df_display_id = 'df_{}'.format(obfuscated_id)
+    # Display ids are only needed when this visualization renders its own web
+    # elements, see _obfuscated_id.
+    self._memoized_obfuscated_id = None
     self._include_window_info = include_window_info
     self._display_facets = display_facets
     self._is_datatable_empty = True
     self._element_type = element_type
+    # The state of the recorded data last rendered into the web elements of
+    # this visualization, see _recorded_data_state.
+    self._displayed_data_state = None
+    # The signature of the data last summarized into the facets-overview of this
+    # visualization, see dataframe_signature.
+    self._overview_data_signature = None
+
+  @property
+  def _obfuscated_id(self):
+    """The unique suffix of the display ids of this visualization.
+
+    Computed on first use because visualizations only updating the web elements
+    of another visualization or only displaying plain text never need it.
+    """
+    if self._memoized_obfuscated_id is None:
+      self._memoized_obfuscated_id = self._stream.display_id(id(self))
+    return self._memoized_obfuscated_id
+
+  @property
+  def _dive_display_id(self):
+    return 'facets_dive_{}'.format(self._obfuscated_id)
+
+  @property
+  def _overview_display_id(self):
+    return 'facets_overview_{}'.format(self._obfuscated_id)
+
+  @property
+  def _df_display_id(self):
+    return 'df_{}'.format(self._obfuscated_id)
 
   def display_plain_text(self):
     """Displays a head sample of the normalized PCollection data.
@@ -279,7 +444,8 @@ class PCollectionVisualization(object):
     # Double check if the dependency is ready in case someone mistakenly uses
     # the function.
     if _pcoll_visualization_ready:
-      data = self._to_dataframe()
+      # Only the elements needed for the head sample are read.
+      data = self._to_dataframe(n=25)
       # Displays a data-table with at most 25 entries from the head.
       data_sample = data.head(25)
       display(data_sample)
@@ -298,9 +464,16 @@ class PCollectionVisualization(object):
     (the uniqueness is guaranteed throughout the lifespan of the PCollection
     variable).
     """
+    max_elements = ie.current_env().options.display_max_elements
+    data_state = self._recorded_data_state(max_elements)
+    if (updating_pv and data_state is not None and
+        data_state == updating_pv._displayed_data_state):
+      _LOGGER.debug(
+          'Skip a visualization update because the recorded data is unchanged.')
+      return
     # Ensures that dive, overview and table render the same data because the
     # materialized PCollection data might being updated continuously.
-    data = self._to_dataframe()
+    data = self._to_dataframe(n=max_elements)
     # Give the numbered column names when visualizing.
     data.columns = [
         self._pcoll_var + '.' +
@@ -309,7 +482,7 @@ class PCollectionVisualization(object):
     ]
     # String-ify the dictionaries for display because elements of type dict
     # cannot be ordered.
-    data = data.applymap(lambda x: str(x) if isinstance(x, dict) else x)
+    stringify_dicts(data, exclude_window_info=self._include_window_info)
     if updating_pv:
       # Only updates when data is not empty. Otherwise, consider it a bad
       # iteration and noop since there is nothing to be updated.
@@ -319,17 +492,39 @@ class PCollectionVisualization(object):
         self._display_dataframe(data.copy(deep=True), updating_pv)
         if self._display_facets:
           self._display_dive(data.copy(deep=True), updating_pv)
-          self._display_overview(data.copy(deep=True), updating_pv)
+          self._display_overview(self._overview_data(data), updating_pv)
+        updating_pv._displayed_data_state = data_state
     else:
       self._display_dataframe(data.copy(deep=True))
       if self._display_facets:
         self._display_dive(data.copy(deep=True))
-        self._display_overview(data.copy(deep=True))
+        self._display_overview(self._overview_data(data))
+      self._displayed_data_state = data_state
+
+  def _overview_data(self, data):
+    """Returns a copy of the data to be summarized by facets-overview.
+
+    The window info is not summarized, so it's left out of the copy instead of
+    being copied and then dropped.
+    """
+    if self._include_window_info and _has_window_info(data):
+      return data.iloc[:, :-len(_WINDOW_INFO_COLUMNS)].copy(deep=True)
+    return data.copy(deep=True)
+
+  def _recorded_data_state(self, max_elements):
+    """Returns a cheap snapshot of the recorded data of the stream that changes
+    whenever the data to be visualized changes. None if it's unknown.
+    """
+    cache_manager = ie.current_env().get_cache_manager(
+        self._stream.pcoll.pipeline)
+    if cache_manager is None:
+      return None
+    return cache_manager.size('full', self._stream.cache_key), max_elements
 
   def _display_dive(self, data, update=None):
     sprite_size = 32 if len(data.index) > 50000 else 64
     format_window_info_in_dataframe(data)
-    jsonstr = data.to_json(orient='records', default_handler=str)
+    jsonstr = dataframe_to_json_records(data)
     if update:
       script = _DIVE_SCRIPT_TEMPLATE.format(
           display_id=update._dive_display_id, jsonstr=jsonstr)
@@ -342,17 +537,20 @@ class PCollectionVisualization(object):
       display(HTML(html_str))
 
   def _display_overview(self, data, update=None):
-    if (not data.empty and self._include_window_info and
-        all(column in data.columns
-            for column in ('event_time', 'windows', 'pane_info'))):
-      data = data.drop(['event_time', 'windows', 'pane_info'], axis=1)
+    # The window info has already been left out by _overview_data.
 
     # GFSG expects all column names to be strings.
     data.columns = data.columns.astype(str)
 
-    gfsg = GenericFeatureStatisticsGenerator()
-    proto = gfsg.ProtoFromDataFrames([{'name': 'data', 'table': data}])
-    protostr = base64.b64encode(proto.SerializeToString()).decode('utf-8')
+    data_signature = dataframe_signature(data)
+    if (update and data_signature is not None and
+        data_signature == update._overview_data_signature):
+      _LOGGER.debug('Skip an overview update due to unchanged data.')
+      return
+    proto = _GFSG.ProtoFromDataFrames([{'name': 'data', 'table': data}])
+    protostr = binascii.b2a_base64(
+        proto.SerializeToString(), newline=False).decode('ascii')
+    (update if update else self)._overview_data_signature = data_signature
     if update:
       script = _OVERVIEW_SCRIPT_TEMPLATE.format(
           display_id=update._overview_display_id, protostr=protostr)
@@ -387,7 +585,7 @@ class PCollectionVisualization(object):
       row[0] = k
     script = _DATAFRAME_SCRIPT_TEMPLATE.format(
         table_id=table_id, columns=columns, data_as_rows=rows)
-    script_in_jquery_with_datatable = ie._JQUERY_WITH_DATATABLE_TEMPLATE.format(
+    script_in_jquery_with_datatable = _JQUERY_WITH_DATATABLE_TEMPLATE.format(
         customized_script=script)
     # Dynamically load data into the existing datatable if not empty.
     if update and not update._is_datatable_empty:
@@ -404,7 +602,7 @@ class PCollectionVisualization(object):
           # Initialize a datatable to replace the existing no data div.
           display(
               Javascript(
-                  ie._JQUERY_WITH_DATATABLE_TEMPLATE.format(
+                  _JQUERY_WITH_DATATABLE_TEMPLATE.format(
                       customized_script=_NO_DATA_REMOVAL_SCRIPT.format(
                           id=table_id))))
           display(HTML(html_str), display_id=update._df_display_id)
@@ -414,23 +612,132 @@ class PCollectionVisualization(object):
         if not data.empty:
           self._is_datatable_empty = False
 
-  def _to_dataframe(self):
-    results = list(self._stream.read(tail=False))
+  def _to_dataframe(self, n=None):
+    # The stream stops reading once n elements have been read, so that at most
+    # n of them are decoded if n is given.
+    elements = self._stream.read(tail=False, n=n)
     return elements_to_df(
-        results, self._include_window_info, element_type=self._element_type)
+        elements, self._include_window_info, element_type=self._element_type)
+
+
+def dataframe_to_json_records(data):
+  """Serializes the given DataFrame into a JSON list of records.
+
+  Uses orjson when it is available, which is much faster than
+  DataFrame.to_json(orient='records', default_handler=str) but doesn't produce
+  the exact same output: timestamps, NaT and Decimals are serialized as their
+  str representations, floats keep their full precision, and only the last of
+  duplicate columns is kept in each record. Falls back to DataFrame.to_json
+  when orjson can't serialize the data, e.g., integers beyond 64 bits.
+  """
+  if orjson is None:
+    return data.to_json(orient='records', default_handler=str)
+  # Reads the data column by column as the DataFrame stores it, then zips the
+  # columns into records, which is much cheaper than to_dict(orient='records').
+  names = list(data.columns)
+  columns = [data.iloc[:, i].tolist() for i in range(len(names))]
+  records = [dict(zip(names, row)) for row in zip(*columns)]
+  try:
+    serialized = orjson.dumps(
+        records,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+  except TypeError:
+    # orjson.JSONEncodeError is a TypeError.
+    return data.to_json(orient='records', default_handler=str)
+  return serialized.decode('utf-8')
+
+
+def dataframe_signature(data):
+  """Returns a digest of the column names and values of the given DataFrame.
+
+  Returns None if the DataFrame holds values that cannot be hashed.
+  """
+  try:
+    row_hashes = pd.util.hash_pandas_object(data, index=False)
+  except (TypeError, ValueError):
+    return None
+  digest = hashlib.sha256(row_hashes.values.tobytes())
+  digest.update(repr(list(data.columns)).encode('utf-8'))
+  return digest.digest()
+
+
+def _has_window_info(data):
+  """Checks if the given DataFrame ends with the window info columns appended
+  by elements_to_df."""
+  num_columns = len(_WINDOW_INFO_COLUMNS)
+  return tuple(data.columns[-num_columns:]) == _WINDOW_INFO_COLUMNS
+
+
+def stringify_dicts(data, exclude_window_info=False):
+  """String-ifies in place the dictionaries in the given DataFrame.
+
+  Only object columns whose values are not inferred to be of a single scalar
+  type can hold dictionaries, so the other columns are left untouched. If
+  exclude_window_info is True, the window info columns are left untouched too
+  since they never hold dictionaries.
+  """
+  num_columns = len(data.columns)
+  if exclude_window_info and _has_window_info(data):
+    num_columns -= len(_WINDOW_INFO_COLUMNS)
+  # Columns are accessed by position because column names might not be unique.
+  for i, dtype in enumerate(data.dtypes[:num_columns]):
+    if dtype != object:
+      continue
+    column = data.iloc[:, i]
+    if infer_dtype(column, skipna=True) in ('mixed', 'mixed-integer'):
+      data.iloc[:, i] = column.map(_stringify_dict)
+
+
+def _stringify_dict(value):
+  return str(value) if isinstance(value, dict) else value
 
 
 def format_window_info_in_dataframe(data):
+  options = ie.current_env().options
   if 'event_time' in data.columns:
-    data['event_time'] = data['event_time'].apply(event_time_formatter)
+    data['event_time'] = event_times_formatter(data['event_time'], options)
   if 'windows' in data.columns:
-    data['windows'] = data['windows'].apply(windows_formatter)
+    data['windows'] = _format_windows_column(data['windows'], options)
   if 'pane_info' in data.columns:
-    data['pane_info'] = data['pane_info'].apply(pane_info_formatter)
+    data['pane_info'] = [pane_info_formatter(p) for p in data['pane_info']]
 
 
-def event_time_formatter(event_time_us):
-  options = ie.current_env().options
+def _format_windows_column(windows_column, options):
+  """Formats the windows of each element. Elements share the same windows in
+  most streams, so each distinct list of windows is only formatted once."""
+  formatted = {}
+  result = []
+  for windows in windows_column:
+    try:
+      key = tuple(windows)
+      if key not in formatted:
+        formatted[key] = windows_formatter(windows, options)
+      result.append(formatted[key])
+    except TypeError:
+      # Custom windows are not necessarily hashable.
+      result.append(windows_formatter(windows, options))
+  return result
+
+
+def event_times_formatter(event_times_us, options=None):
+  """Formats a Series of event times in microseconds at once, which is
+  equivalent to applying event_time_formatter to each of them."""
+  if event_times_us.empty:
+    return event_times_us
+  options = options or ie.current_env().options
+  try:
+    return pd.to_datetime(
+        event_times_us, unit='us',
+        utc=True).dt.tz_convert(options.display_timezone).dt.strftime(
+            options.display_timestamp_format)
+  except (ValueError, OverflowError):
+    # Some event times are out of the bounds of pandas timestamps.
+    return event_times_us.apply(lambda t: event_time_formatter(t, options))
+
+
+def event_time_formatter(event_time_us, options=None):
+  options = options or ie.current_env().options
   to_tz = options.display_timezone
   try:
     return (
@@ -443,42 +750,48 @@ def event_time_formatter(event_time_us):
     return 'Max Timestamp'
 
 
-def windows_formatter(windows):
+def windows_formatter(windows, options=None):
+  options = options or ie.current_env().options
   result = []
   for w in windows:
     if isinstance(w, GlobalWindow):
       result.append(str(w))
     elif isinstance(w, IntervalWindow):
-      # First get the duration in terms of hours, minutes, seconds, and
-      # micros.
-      duration = w.end.micros - w.start.micros
-      duration_secs = duration // 1000000
-      hours, remainder = divmod(duration_secs, 3600)
-      minutes, seconds = divmod(remainder, 60)
-      micros = (duration - duration_secs * 1000000) % 1000000
-
-      # Construct the duration string. Try and write the string in such a
-      # way that minimizes the amount of characters written.
-      duration = ''
-      if hours:
-        duration += '{}h '.format(hours)
-
-      if minutes or (hours and seconds):
-        duration += '{}m '.format(minutes)
-
-      if seconds:
-        if micros:
-          duration += '{}.{:06}s'.format(seconds, micros)
-        else:
-          duration += '{}s'.format(seconds)
-
-      start = event_time_formatter(w.start.micros)
-
+      start = event_time_formatter(w.start.micros, options)
+      duration = _format_interval_duration(w.end.micros - w.start.micros)
       result.append('{} ({})'.format(start, duration))
 
   return ','.join(result)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_interval_duration(duration):
+  """Formats a duration in microseconds. Cached since windows of the same size
+  are formatted repeatedly, e.g., for fixed windows."""
+  # First get the duration in terms of hours, minutes, seconds, and
+  # micros.
+  duration_secs = duration // 1000000
+  hours, remainder = divmod(duration_secs, 3600)
+  minutes, seconds = divmod(remainder, 60)
+  micros = (duration - duration_secs * 1000000) % 1000000
+
+  # Construct the duration string. Try and write the string in such a
+  # way that minimizes the amount of characters written.
+  result = ''
+  if hours:
+    result += '{}h '.format(hours)
+
+  if minutes or (hours and seconds):
+    result += '{}m '.format(minutes)
+
+  if seconds:
+    if micros:
+      result += '{}.{:06}s'.format(seconds, micros)
+    else:
+      result += '{}s'.format(seconds)
+  return result
+
+
 def pane_info_formatter(pane_info):
   from apache_beam.utils.windowed_value import PaneInfo
   from apache_beam.utils.windowed_value import PaneInfoTiming
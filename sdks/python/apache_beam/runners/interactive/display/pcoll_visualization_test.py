@@ -18,11 +18,14 @@
 """Tests for apache_beam.runners.interactive.display.pcoll_visualization."""
 # pytype: skip-file
 
+import asyncio
+import decimal
 import unittest
 from unittest.mock import ANY
 from unittest.mock import PropertyMock
 from unittest.mock import patch
 
+import pandas as pd
 import pytz
 
 import apache_beam as beam
@@ -38,11 +41,6 @@ from apache_beam.transforms.window import IntervalWindow
 from apache_beam.utils.windowed_value import PaneInfo
 from apache_beam.utils.windowed_value import PaneInfoTiming
 
-try:
-  import timeloop
-except ImportError:
-  pass
-
 
 @unittest.skipIf(
     not ie.current_env().is_interactive_ready,
@@ -76,6 +74,18 @@ class PCollectionVisualizationTest(unittest.TestCase):
     self.assertNotEqual(pv_1._overview_display_id, pv_2._overview_display_id)
     self.assertNotEqual(pv_1._df_display_id, pv_2._df_display_id)
 
+  def test_display_ids_computed_on_first_use(self):
+    with patch.object(self._stream, 'display_id',
+                      wraps=self._stream.display_id) as mocked_display_id:
+      visualization = pv.PCollectionVisualization(self._stream)
+      mocked_display_id.assert_not_called()
+      dive_display_id = visualization._dive_display_id
+      self.assertEqual(visualization._dive_display_id, dive_display_id)
+      self.assertEqual(
+          visualization._df_display_id,
+          'df_' + dive_display_id[len('facets_dive_'):])
+      mocked_display_id.assert_called_once_with(id(visualization))
+
   @patch('IPython.get_ipython', new_callable=mock_get_ipython)
   @patch(
       'apache_beam.runners.interactive.interactive_environment'
@@ -95,9 +105,79 @@ class PCollectionVisualizationTest(unittest.TestCase):
     mocked_is_in_notebook.return_value = True
     h = pv.visualize(
         self._stream, dynamic_plotting_interval=1, display_facets=True)
-    self.assertIsInstance(h, timeloop.Timeloop)
+    self.assertIsInstance(h, pv._DynamicPlotting)
+    h.stop()
+    self.assertTrue(h.is_stopped())
+    # Excessive stops are ignored.
     h.stop()
 
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  @patch(
+      'apache_beam.runners.interactive.interactive_environment'
+      '.InteractiveEnvironment.is_in_notebook',
+      new_callable=PropertyMock)
+  def test_dynamic_plotting_stop_logs_no_error(
+      self, mocked_is_in_notebook, unused):
+    mocked_is_in_notebook.return_value = True
+    with patch.object(pv._LOGGER, 'exception') as mocked_exception:
+      h = pv.visualize(self._stream, dynamic_plotting_interval=60)
+      # Waits for the refresh to start waiting for its first update.
+      asyncio.run_coroutine_threadsafe(
+          asyncio.sleep(0), pv._refresh_event_loop()).result(timeout=10)
+      h.stop()
+      # Waits for the event loop to process the cancellation of the refresh.
+      asyncio.run_coroutine_threadsafe(
+          asyncio.sleep(0), pv._refresh_event_loop()).result(timeout=10)
+    self.assertTrue(h.is_stopped())
+    self.assertTrue(h._future.cancelled())
+    mocked_exception.assert_not_called()
+
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  @patch(
+      'apache_beam.runners.interactive.interactive_environment'
+      '.InteractiveEnvironment.is_in_notebook',
+      new_callable=PropertyMock)
+  def test_dynamic_plotting_stops_when_stream_is_done(
+      self, mocked_is_in_notebook, unused):
+    mocked_is_in_notebook.return_value = True
+    with patch.object(self._stream, 'is_done', return_value=True), patch(
+        'apache_beam.runners.interactive.display.pcoll_visualization'
+        '.PCollectionVisualization.display') as mocked_display:
+      h = pv.visualize(self._stream, dynamic_plotting_interval=0.01)
+      h._future.result(timeout=10)
+    self.assertTrue(h.is_stopped())
+    # The initial display and exactly one update before the stream is done.
+    self.assertEqual(mocked_display.call_count, 2)
+    mocked_display.assert_called_with(updating_pv=ANY)
+
+  @patch('IPython.get_ipython', new_callable=mock_get_ipython)
+  @patch(
+      'apache_beam.runners.interactive.interactive_environment'
+      '.InteractiveEnvironment.is_in_notebook',
+      new_callable=PropertyMock)
+  @patch(
+      'apache_beam.runners.interactive.display.pcoll_visualization'
+      '.PCollectionVisualization._display_dataframe')
+  def test_dynamic_plotting_stops_when_terminated_without_new_data(
+      self, mocked_display_dataframe, mocked_is_in_notebook, unused):
+    mocked_is_in_notebook.return_value = True
+    # The stream isn't done by reading all the 5 recorded elements.
+    stream = RecordingManager(self._p).record([self._pcoll], 10,
+                                              10).stream(self._pcoll)
+    fake_pipeline_result = runner.PipelineResult(runner.PipelineState.RUNNING)
+    ie.current_env().set_pipeline_result(self._p, fake_pipeline_result)
+    h = pv.visualize(stream, dynamic_plotting_interval=0.01)
+    mocked_display_dataframe.assert_called_once_with(ANY)
+    self.assertFalse(stream.is_done())
+
+    # The pipeline terminates without recording any new data, so every update
+    # is skipped without reading the stream.
+    fake_pipeline_result = runner.PipelineResult(runner.PipelineState.DONE)
+    ie.current_env().set_pipeline_result(self._p, fake_pipeline_result)
+    h._future.result(timeout=10)
+    self.assertTrue(h.is_stopped())
+    mocked_display_dataframe.assert_called_once_with(ANY)
+
   @patch('IPython.get_ipython', new_callable=mock_get_ipython)
   @patch(
       'apache_beam.runners.interactive.interactive_environment'
@@ -141,6 +221,61 @@ class PCollectionVisualizationTest(unittest.TestCase):
     mocked_display_dive.assert_called_once_with(
         ANY, original_pcollection_visualization)
 
+  @patch(
+      'apache_beam.runners.interactive.display.pcoll_visualization'
+      '.PCollectionVisualization._display_dataframe')
+  def test_dynamic_plotting_skips_update_when_recorded_data_unchanged(
+      self, mocked_display_dataframe):
+    original_pcollection_visualization = pv.PCollectionVisualization(
+        self._stream)
+    original_pcollection_visualization.display()
+    mocked_display_dataframe.assert_called_once_with(ANY)
+
+    new_pcollection_visualization = pv.PCollectionVisualization(self._stream)
+    new_pcollection_visualization.display(
+        updating_pv=original_pcollection_visualization)
+    # Nothing has been recorded since the last display.
+    mocked_display_dataframe.assert_called_once_with(ANY)
+
+  @patch(
+      'apache_beam.runners.interactive.display.pcoll_visualization'
+      '.display_javascript')
+  def test_overview_update_skipped_when_data_unchanged(
+      self, mocked_display_javascript):
+    original_pcollection_visualization = pv.PCollectionVisualization(
+        self._stream, display_facets=True)
+    data = pd.DataFrame({'Value': [1, 2, 3]})
+    for _ in range(2):
+      pv.PCollectionVisualization(
+          self._stream, display_facets=True)._display_overview(
+              data.copy(deep=True), original_pcollection_visualization)
+    mocked_display_javascript.assert_called_once()
+
+    data = pd.DataFrame({'Value': [1, 2, 4]})
+    pv.PCollectionVisualization(
+        self._stream, display_facets=True)._display_overview(
+            data.copy(deep=True), original_pcollection_visualization)
+    self.assertEqual(mocked_display_javascript.call_count, 2)
+
+  @patch(
+      'apache_beam.runners.interactive.display.pcoll_visualization'
+      '.display_javascript')
+  def test_overview_keeps_user_columns_named_as_window_info(
+      self, unused_mocked_display_javascript):
+    visualization = pv.PCollectionVisualization(
+        self._stream, include_window_info=True, display_facets=True)
+    data = pd.DataFrame({
+        'event_time': [1], 'windows': [2], 'pane_info': [3], 'Value': [4]
+    })
+    with patch.object(pv._GFSG,
+                      'ProtoFromDataFrames',
+                      wraps=pv._GFSG.ProtoFromDataFrames) as mocked_proto:
+      visualization._display_overview(
+          visualization._overview_data(data), visualization)
+    summarized_data = mocked_proto.call_args[0][0][0]['table']
+    self.assertEqual(['event_time', 'windows', 'pane_info', 'Value'],
+                     list(summarized_data.columns))
+
   def test_auto_stop_dynamic_plotting_when_job_is_terminated(self):
     fake_pipeline_result = runner.PipelineResult(runner.PipelineState.RUNNING)
     ie.current_env().set_pipeline_result(self._p, fake_pipeline_result)
@@ -159,6 +294,32 @@ class PCollectionVisualizationTest(unittest.TestCase):
     self.assertIsNone(pv.visualize(self._stream, display_facets=True))
     _mocked_head.assert_called_once()
 
+  def test_to_dataframe_reads_at_most_n_elements(self):
+    visualization = pv.PCollectionVisualization(self._stream)
+    self.assertEqual(len(visualization._to_dataframe(n=2)), 2)
+    self.assertEqual(len(visualization._to_dataframe()), 5)
+
+  def test_to_dataframe_with_n_marks_stream_done_when_terminated(self):
+    fake_pipeline_result = runner.PipelineResult(runner.PipelineState.DONE)
+    ie.current_env().set_pipeline_result(self._p, fake_pipeline_result)
+    visualization = pv.PCollectionVisualization(self._stream)
+    self.assertFalse(self._stream.is_done())
+    self.assertEqual(len(visualization._to_dataframe(n=2)), 2)
+    self.assertTrue(self._stream.is_done())
+
+  @patch(
+      'apache_beam.runners.interactive.display.pcoll_visualization'
+      '.PCollectionVisualization._display_dataframe')
+  def test_display_reads_at_most_display_max_elements(
+      self, mocked_display_dataframe):
+    ib.options.display_max_elements = 2
+    try:
+      pv.PCollectionVisualization(self._stream).display()
+    finally:
+      ib.options.display_max_elements = None
+    displayed_data = mocked_display_dataframe.call_args[0][0]
+    self.assertEqual(len(displayed_data), 2)
+
   def test_event_time_formatter(self):
     # In microseconds: Monday, March 2, 2020 3:14:54 PM GMT-08:00
     event_time_us = 1583190894000000
@@ -180,6 +341,19 @@ class PCollectionVisualizationTest(unittest.TestCase):
     event_time_us = 253402300800000000
     self.assertEqual('Max Timestamp', pv.event_time_formatter(event_time_us))
 
+  def test_event_times_formatter(self):
+    event_times_us = pd.Series([1583190894000000, 1583190894000015])
+    self.assertEqual(
+        ['2020-03-02 15:14:54.000000-0800', '2020-03-02 15:14:54.000015-0800'],
+        list(pv.event_times_formatter(event_times_us)))
+
+  def test_event_times_formatter_overflow(self):
+    event_times_us = pd.Series(
+        [1583190894000000, -100000000000000000, 253402300800000000])
+    self.assertEqual(
+        ['2020-03-02 15:14:54.000000-0800', 'Min Timestamp', 'Max Timestamp'],
+        list(pv.event_times_formatter(event_times_us)))
+
   def test_windows_formatter_global(self):
     gw = GlobalWindow()
     self.assertEqual(str(gw), pv.windows_formatter([gw]))
@@ -191,6 +365,35 @@ class PCollectionVisualizationTest(unittest.TestCase):
         '2020-03-02 15:14:54.000000-0800 (2h 31m 46s)',
         pv.windows_formatter([iw]))
 
+  def test_format_windows_in_dataframe_once_per_distinct_windows(self):
+    iw_1 = IntervalWindow(start=1583190894, end=1583200000)
+    iw_2 = IntervalWindow(start=1583200000, end=1583200010)
+    data = pd.DataFrame({'windows': [[iw_1], [iw_2], [iw_1], [iw_1]]})
+    with patch('apache_beam.runners.interactive.display.pcoll_visualization'
+               '.windows_formatter',
+               wraps=pv.windows_formatter) as mocked_windows_formatter:
+      pv.format_window_info_in_dataframe(data)
+    self.assertEqual(mocked_windows_formatter.call_count, 2)
+    formatted_iw_1 = '2020-03-02 15:14:54.000000-0800 (2h 31m 46s)'
+    formatted_iw_2 = '2020-03-02 17:46:40.000000-0800 (10s)'
+    self.assertEqual(
+        [formatted_iw_1, formatted_iw_2, formatted_iw_1, formatted_iw_1],
+        list(data['windows']))
+
+  def test_format_window_info_in_dataframe_reads_options_once(self):
+    iw = IntervalWindow(start=1583190894, end=1583200000)
+    data = pd.DataFrame({
+        'event_time': [1583190894000000, 253402300800000000],
+        'windows': [[iw], [GlobalWindow()]]
+    })
+    with patch(
+        'apache_beam.runners.interactive.interactive_environment.current_env',
+        wraps=ie.current_env) as mocked_current_env:
+      pv.format_window_info_in_dataframe(data)
+    mocked_current_env.assert_called_once()
+    self.assertEqual(['2020-03-02 15:14:54.000000-0800', 'Max Timestamp'],
+                     list(data['event_time']))
+
   def test_pane_info_formatter(self):
     self.assertEqual(
         'Pane 0: Final Early',
@@ -202,6 +405,91 @@ class PCollectionVisualizationTest(unittest.TestCase):
                 index=0,
                 nonspeculative_index=0)))
 
+  def test_dataframe_to_json_records(self):
+    data = pd.DataFrame({
+        'ints': [1, 2],
+        'floats': [1.5, float('nan')],
+        'strs': ['a', None],
+        'tuples': [(1, 2), (3, 4)]
+    })
+    self.assertEqual(
+        data.to_json(orient='records', default_handler=str),
+        pv.dataframe_to_json_records(data))
+
+  def test_dataframe_to_json_records_by_column_position(self):
+    data = pd.DataFrame([[1, 'a'], [2, 'b']])
+    self.assertEqual(
+        '[{"0":1,"1":"a"},{"0":2,"1":"b"}]', pv.dataframe_to_json_records(data))
+    self.assertEqual('[]', pv.dataframe_to_json_records(data.iloc[:0]))
+
+  def test_dataframe_to_json_records_falls_back_for_big_ints(self):
+    data = pd.DataFrame({'ints': [2**64, 1]})
+    self.assertEqual(
+        '[{"ints":18446744073709551616},{"ints":1}]',
+        pv.dataframe_to_json_records(data))
+
+  @unittest.skipIf(pv.orjson is None, 'orjson is not installed.')
+  def test_dataframe_to_json_records_with_orjson(self):
+    data = pd.DataFrame({
+        'timestamps': [pd.Timestamp('2020-01-01 01:02:03'), pd.NaT],
+        'floats': [0.1 + 0.2, 1.0],
+        'decimals': [decimal.Decimal('1.5'), None]
+    })
+    self.assertEqual(
+        '[{"timestamps":"2020-01-01 01:02:03","floats":0.30000000000000004,'
+        '"decimals":"1.5"},'
+        '{"timestamps":"NaT","floats":1.0,"decimals":null}]',
+        pv.dataframe_to_json_records(data))
+    duplicate_columns = pd.DataFrame([[1, 2]], columns=['a', 'a'])
+    self.assertEqual(
+        '[{"a":2}]', pv.dataframe_to_json_records(duplicate_columns))
+
+  def test_stringify_dicts(self):
+    data = pd.DataFrame({
+        'ints': [1, 2],
+        'strs': ['a', 'b'],
+        'dicts': [{
+            'k': 1
+        }, None],
+        'mixed': ['a', {
+            'k': 2
+        }]
+    })
+    pv.stringify_dicts(data)
+    pd.testing.assert_frame_equal(
+        data,
+        pd.DataFrame({
+            'ints': [1, 2],
+            'strs': ['a', 'b'],
+            'dicts': ["{'k': 1}", None],
+            'mixed': ['a', "{'k': 2}"]
+        }))
+
+  def test_stringify_dicts_excludes_window_info(self):
+    # Never the case in practice, only to tell that the column is not touched.
+    windows = {'not_a': 'window'}
+    data = pd.DataFrame({
+        'dicts': [{
+            'k': 1
+        }],
+        'event_time': [0],
+        'windows': [windows],
+        'pane_info': [None]
+    })
+    pv.stringify_dicts(data, exclude_window_info=True)
+    self.assertEqual(data['dicts'][0], "{'k': 1}")
+    self.assertIs(data['windows'][0], windows)
+
+  def test_precompiled_template_formats_as_str_format(self):
+    template = """
+        {{ "{display_id}": {jsonstr} }}
+        <div id="{display_id}"></div>"""
+    jsonstr = [{'a': 1}]
+    self.assertEqual(
+        template.format(display_id='facets_dive_0', jsonstr=jsonstr),
+        pv._PrecompiledTemplate(template).format(
+            display_id='facets_dive_0', jsonstr=jsonstr))
+
 
 if __name__ == '__main__':
   unittest.main()
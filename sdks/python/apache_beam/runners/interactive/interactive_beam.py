@@ -168,6 +168,25 @@ class Options(interactive_options.InteractiveOptions):
           value)
       self.capture_control._capture_size_limit = value
 
+  @property
+  def recording_poll_interval(self):
+    """The interval in seconds at which the limits of a background source
+    recording job, such as its recording size, are checked."""
+    return self.capture_control._recording_poll_interval_secs
+
+  @recording_poll_interval.setter
+  def recording_poll_interval(self, value):
+    """Sets the interval in seconds at which the limits of background source
+    recording jobs are checked. It applies to jobs started afterwards.
+
+    Example::
+
+      # Checks the recording size limit every 5 seconds.
+      interactive_beam.options.recording_poll_interval = 5
+    """
+    assert value > 0, 'recording_poll_interval needs to be positive.'
+    self.capture_control._recording_poll_interval_secs = value
+
   @property
   def display_timestamp_format(self):
     """The format in which timestamps are displayed.
@@ -218,6 +237,31 @@ class Options(interactive_options.InteractiveOptions):
     """
     self._display_timezone = value
 
+  @property
+  def display_max_elements(self):
+    """The maximum number of elements read from the recording of a PCollection
+    when visualizing it.
+
+    Defaults to None, which visualizes all recorded elements.
+    """
+    return self._display_max_elements
+
+  @display_max_elements.setter
+  def display_max_elements(self, value):
+    """Sets the maximum number of elements read from the recording of a
+    PCollection when visualizing it.
+
+    Defaults to None, which visualizes all recorded elements.
+
+    Example::
+
+      # Only visualizes the first 1000 recorded elements of a PCollection.
+      interactive_beam.options.display_max_elements = 1000
+    """
+    assert value is None or value > 0, (
+        'display_max_elements needs to be positive or None.')
+    self._display_max_elements = value
+
 
 class Recordings():
   """An introspection interface for recordings for pipelines.
@@ -43,6 +43,7 @@ class CaptureControl(object):
     }  # yapf: disable
     self._capture_duration = timedelta(seconds=60)
     self._capture_size_limit = 1e9
+    self._recording_poll_interval_secs = 0.5
     self._test_limiters = None
 
   def limiters(self):
@@ -54,6 +55,10 @@ class CaptureControl(object):
         capture_limiters.DurationLimiter(self._capture_duration)
     ]
 
+  def poll_interval_secs(self):
+    # type: () -> float
+    return self._recording_poll_interval_secs
+
   def set_limiters_for_test(self, limiters):
     # type: (List[capture_limiters.Limiter]) -> None
     self._test_limiters = limiters
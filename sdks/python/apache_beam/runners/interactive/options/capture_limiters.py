@@ -20,7 +20,7 @@
 For internal use only; no backwards-compatibility guarantees.
 """
 
-import threading
+import time
 
 import pandas as pd
 
@@ -39,6 +39,14 @@ class Limiter:
     """Returns True if the limiter has triggered, and caching should stop."""
     raise NotImplementedError
 
+  def secs_until_triggered(self):
+    # type: () -> Optional[float]
+
+    """Returns the number of seconds after which the limiter triggers if it is
+    known ahead of time, None otherwise.
+    """
+    return None
+
 
 class ElementLimiter(Limiter):
   """A `Limiter` that limits reading from cache based on some property of an
@@ -79,16 +87,13 @@ class DurationLimiter(Limiter):
       duration_limit  # type: datetime.timedelta
   ):
     self._duration_limit = duration_limit
-    self._timer = threading.Timer(duration_limit.total_seconds(), self._trigger)
-    self._timer.daemon = True
-    self._triggered = False
-    self._timer.start()
+    self._deadline = time.monotonic() + duration_limit.total_seconds()
 
-  def _trigger(self):
-    self._triggered = True
+  def secs_until_triggered(self):
+    return max(0, self._deadline - time.monotonic())
 
   def is_triggered(self):
-    return self._triggered
+    return time.monotonic() >= self._deadline
 
 
 class CountLimiter(ElementLimiter):
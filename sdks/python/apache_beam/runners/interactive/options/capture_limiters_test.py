@@ -15,12 +15,15 @@
 # limitations under the License.
 #
 
+import time
 import unittest
+from datetime import timedelta
 
 import pandas as pd
 
 from apache_beam.portability.api.beam_runner_api_pb2 import TestStreamPayload
 from apache_beam.runners.interactive.options.capture_limiters import CountLimiter
+from apache_beam.runners.interactive.options.capture_limiters import DurationLimiter
 from apache_beam.runners.interactive.options.capture_limiters import ProcessingTimeLimiter
 from apache_beam.utils.windowed_value import WindowedValue
 
@@ -62,6 +65,21 @@ class CaptureLimitersTest(unittest.TestCase):
     limiter.update(e)
     self.assertTrue(limiter.is_triggered())
 
+  def test_duration_limiter_secs_until_triggered(self):
+    limiter = DurationLimiter(timedelta(seconds=3600))
+    self.assertGreater(limiter.secs_until_triggered(), 3500)
+    self.assertLessEqual(limiter.secs_until_triggered(), 3600)
+    self.assertIsNone(CountLimiter(5).secs_until_triggered())
+
+  def test_duration_limiter(self):
+    limiter = DurationLimiter(timedelta(seconds=0.1))
+    self.assertFalse(limiter.is_triggered())
+    self.assertLessEqual(limiter.secs_until_triggered(), 0.1)
+
+    time.sleep(limiter.secs_until_triggered())
+    self.assertTrue(limiter.is_triggered())
+    self.assertEqual(limiter.secs_until_triggered(), 0)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -34,6 +34,7 @@ class InteractiveOptions(object):
     self._capture_control = capture_control.CaptureControl()
     self._display_timestamp_format = '%Y-%m-%d %H:%M:%S.%f%z'
     self._display_timezone = tz.tzlocal()
+    self._display_max_elements = None
 
   def __repr__(self):
     options_str = '\n'.join(
@@ -64,15 +64,17 @@ class PipelineInstrument(object):
       self._cache_manager = ie.current_env().get_cache_manager(
           self._user_pipeline)
 
-    self._background_caching_pipeline = beam.pipeline.Pipeline.from_runner_api(
-        pipeline.to_runner_api(), pipeline.runner, options)
-    ie.current_env().add_derived_pipeline(
-        self._pipeline, self._background_caching_pipeline)
-
     # Snapshot of original pipeline information.
     (self._original_pipeline_proto,
      context) = self._pipeline.to_runner_api(return_context=True)
 
+    # The snapshot is only read when building the background caching pipeline,
+    # so the pipeline doesn't need to be serialized again.
+    self._background_caching_pipeline = beam.pipeline.Pipeline.from_runner_api(
+        self._original_pipeline_proto, pipeline.runner, options)
+    ie.current_env().add_derived_pipeline(
+        self._pipeline, self._background_caching_pipeline)
+
     # All compute-once-against-original-pipeline fields.
     self._unbounded_sources = unbounded_sources(
         self._background_caching_pipeline)
@@ -844,13 +846,14 @@ def unbounded_sources(pipeline):
     """
     def __init__(self):
       self.unbounded_sources = []
+      self._recordable_sources = tuple(
+          ie.current_env().options.recordable_sources)
 
     def enter_composite_transform(self, transform_node):
       self.visit_transform(transform_node)
 
     def visit_transform(self, transform_node):
-      if isinstance(transform_node.transform,
-                    tuple(ie.current_env().options.recordable_sources)):
+      if isinstance(transform_node.transform, self._recordable_sources):
         self.unbounded_sources.append(transform_node)
 
   v = CheckUnboundednessVisitor()
@@ -97,10 +97,14 @@ class ElementStream:
     """Returns True if no more new elements will be yielded."""
     return self._done
 
-  def read(self, tail=True):
-    # type: (boolean) -> Any
+  def read(self, tail=True, n=None):
+    # type: (boolean, Optional[int]) -> Any
 
-    """Reads the elements currently recorded."""
+    """Reads the elements currently recorded.
+
+    If n is given, at most n elements are read. Reaching n doesn't mark the
+    stream as done unless n is the maximum number of elements of the stream.
+    """
 
     # Get the cache manager and wait until the file exists.
     cache_manager = ie.current_env().get_cache_manager(self._pipeline)
@@ -123,31 +127,36 @@ class ElementStream:
     # the case that the pipeline was still running. Thus, another invocation of
     # `read` will yield new elements.
     count_limiter = CountLimiter(self._n)
+    limit = self._n if n is None else min(n, self._n)
+    read_limiter = count_limiter if limit == self._n else CountLimiter(limit)
     time_limiter = ProcessingTimeLimiter(self._duration_secs)
-    limiters = (count_limiter, time_limiter)
+    # A local name spares the attribute lookup for each element.
+    event_type = TestStreamPayload.Event
     for e in utils.to_element_list(reader,
                                    coder,
                                    include_window_info=True,
-                                   n=self._n,
+                                   n=limit,
                                    include_time_events=True):
 
       # From the to_element_list we either get TestStreamPayload.Events if
       # include_time_events or decoded elements from the reader. Make sure we
       # only count the decoded elements to break early.
-      if isinstance(e, TestStreamPayload.Event):
+      if isinstance(e, event_type):
         time_limiter.update(e)
       else:
         count_limiter.update(e)
+        if read_limiter is not count_limiter:
+          read_limiter.update(e)
         yield e
 
-      if any(l.is_triggered() for l in limiters):
+      if read_limiter.is_triggered() or time_limiter.is_triggered():
         break
 
     # A limiter being triggered means that we have fulfilled the user's request.
     # This implies that reading from the cache again won't yield any new
     # elements. WLOG, this applies to the user pipeline being terminated.
-    if any(l.is_triggered()
-           for l in limiters) or ie.current_env().is_terminated(self._pipeline):
+    if (count_limiter.is_triggered() or time_limiter.is_triggered() or
+        ie.current_env().is_terminated(self._pipeline)):
       self._done = True
 
 
@@ -139,6 +139,28 @@ class ElementStreamTest(unittest.TestCase):
     self.assertEqual(list(stream.read()), list(range(5)))
     self.assertTrue(stream.is_done())
 
+  def test_read_at_most_n_of_max_n(self):
+    """Test that a read capped below max_n only finishes the stream once the
+    pipeline is terminated."""
+
+    self.cache.write(list(range(5)), 'full', self.cache_key)
+    self.cache.save_pcoder(None, 'full', self.cache_key)
+
+    stream = ElementStream(
+        self.pcoll, '', self.cache_key, max_n=5, max_duration_secs=10)
+    self.assertEqual(list(stream.read(n=2)), [0, 1])
+    self.assertFalse(stream.is_done())
+
+    self.mock_result.set_state(PipelineState.DONE)
+    self.assertEqual(list(stream.read(n=2)), [0, 1])
+    self.assertTrue(stream.is_done())
+
+    # A cap above max_n is bounded by max_n.
+    stream = ElementStream(
+        self.pcoll, '', self.cache_key, max_n=3, max_duration_secs=10)
+    self.assertEqual(list(stream.read(n=10)), [0, 1, 2])
+    self.assertTrue(stream.is_done())
+
   def test_read_duration(self):
     """Test that the stream only reads a 'duration' of elements."""
     def as_windowed_value(element):
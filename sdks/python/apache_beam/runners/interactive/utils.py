@@ -18,10 +18,12 @@
 """Utilities to be used in  Interactive Beam.
 """
 
+import ctypes
 import functools
 import hashlib
 import json
 import logging
+import sys
 
 import pandas as pd
 
@@ -31,6 +33,17 @@ from apache_beam.typehints.schemas import named_fields_from_element_type
 
 _LOGGER = logging.getLogger(__name__)
 
+# The option of prctl(2) setting the timer slack of the calling thread.
+_PR_SET_TIMERSLACK = 29
+
+# Timer slack in nanoseconds for threads that only wake up to check conditions
+# that don't need to be acted on precisely, e.g. the limits of a recording.
+_CONDITION_CHECK_TIMER_SLACK_NS = 500000
+
+# The kinds of TestStreamPayload.Event that advance time instead of carrying
+# elements.
+_TIME_EVENTS = frozenset(('watermark_event', 'processing_time_event'))
+
 
 def to_element_list(
     reader,  # type: Generator[Union[TestStreamPayload.Event, WindowedValueHolder]]
@@ -47,10 +60,14 @@ def to_element_list(
   # Defining a generator like this makes it easier to limit the count of
   # elements read. Otherwise, the count limit would need to be duplicated.
   def elements():
+    # Local names spare the attribute lookups for each element. Neither type
+    # is subclassed, so exact type checks replace isinstance checks.
+    event_type = TestStreamPayload.Event
+    holder_type = WindowedValueHolder
     for e in reader:
-      if isinstance(e, TestStreamPayload.Event):
-        if (e.HasField('watermark_event') or
-            e.HasField('processing_time_event')):
+      e_type = type(e)
+      if e_type is event_type:
+        if e.WhichOneof('event') in _TIME_EVENTS:
           if include_time_events:
             yield e
         else:
@@ -59,7 +76,7 @@ def to_element_list(
             yield (
                 decoded.windowed_value
                 if include_window_info else decoded.windowed_value.value)
-      elif isinstance(e, WindowedValueHolder):
+      elif e_type is holder_type:
         yield (
             e.windowed_value if include_window_info else e.windowed_value.value)
       else:
@@ -79,11 +96,14 @@ def to_element_list(
 
 
 def elements_to_df(elements, include_window_info=False, element_type=None):
-  # type: (List[WindowedValue], bool, Any) -> DataFrame
+  # type: (Iterable[WindowedValue], bool, Any) -> DataFrame
 
   """Parses the given elements into a Dataframe.
 
-  If the elements are a list of WindowedValues, then it will break out the
+  The elements are consumed in a single pass, so they can be given as a lazy
+  iterator such as the one returned by to_element_list.
+
+  If the elements are WindowedValues, then it will break out the
   elements into their own DataFrame and return it. If include_window_info is
   True, then it will concatenate the windowing information onto the elements
   DataFrame.
@@ -267,3 +287,26 @@ def as_json(func):
       return str(return_value)
 
   return return_as_json
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+  return ctypes.CDLL('libc.so.6', use_errno=True)
+
+
+def set_timer_slack_of_current_thread(slack_ns=_CONDITION_CHECK_TIMER_SLACK_NS):
+  # type: (int) -> bool
+
+  """Allows the kernel to defer the timed wake-ups of the current thread by up
+  to slack_ns nanoseconds so that they can be coalesced with other wake-ups.
+
+  Only supported on Linux. Returns True if the timer slack has been set.
+  """
+  if not sys.platform.startswith('linux'):
+    return False
+  try:
+    return _libc().prctl(
+        _PR_SET_TIMERSLACK, ctypes.c_ulong(slack_ns), 0, 0, 0) == 0
+  except (OSError, AttributeError):
+    _LOGGER.debug('Failed to set the timer slack.', exc_info=True)
+    return False
@@ -17,6 +17,8 @@
 
 import json
 import logging
+import sys
+import threading
 import unittest
 from typing import NamedTuple
 from unittest.mock import PropertyMock
@@ -272,5 +274,24 @@ class MessagingUtilTest(unittest.TestCase):
     self.assertEqual(json.loads(dummy()), MessagingUtilTest.SAMPLE_DATA)
 
 
+class TimerSlackTest(unittest.TestCase):
+  @unittest.skipIf(
+      not sys.platform.startswith('linux'), 'Timer slack is Linux only.')
+  def test_set_timer_slack_of_current_thread(self):
+    # The option of prctl(2) getting the timer slack of the calling thread.
+    PR_GET_TIMERSLACK = 30
+    timer_slacks = []
+
+    def set_and_get_timer_slack():
+      timer_slacks.append(utils.set_timer_slack_of_current_thread(123000))
+      timer_slacks.append(utils._libc().prctl(PR_GET_TIMERSLACK, 0, 0, 0, 0))
+
+    # Runs in a separate thread to leave the timer slack of the test untouched.
+    t = threading.Thread(target=set_and_get_timer_slack)
+    t.start()
+    t.join()
+    self.assertEqual(timer_slacks, [True, 123000])
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -209,7 +209,6 @@ INTERACTIVE_BEAM = [
     # Skip version 6.1.13 due to
     # https://github.com/jupyter/jupyter_client/issues/637
     'jupyter-client>=6.1.11,<6.1.13',
-    'timeloop>=1.0.2,<2',
 ]
 
 INTERACTIVE_BEAM_TEST = [